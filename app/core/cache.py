@@ -0,0 +1,42 @@
+"""
+Redis client for response caching
+
+Caching is best effort: callers treat any failure as a cache miss and read
+from the database instead.
+"""
+import asyncio
+from typing import Optional
+
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+
+# Singleton client, rebuilt if used from a different event loop
+# (e.g. a Celery task running its own asyncio.run)
+_cache_client: Optional[aioredis.Redis] = None
+_cache_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_cache_client() -> aioredis.Redis:
+    """Get or create the Redis cache client for the running event loop."""
+    global _cache_client, _cache_client_loop
+    loop = asyncio.get_running_loop()
+    if _cache_client is None or _cache_client_loop is not loop:
+        # Short timeouts: a slow cache must never be slower than the database
+        _cache_client = aioredis.Redis.from_url(
+            settings.CACHE_REDIS_URL,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25,
+        )
+        _cache_client_loop = loop
+    return _cache_client
+
+
+async def close_cache_client() -> None:
+    """Close the cache client's connection pool (application shutdown)."""
+    global _cache_client, _cache_client_loop
+    if _cache_client is not None:
+        await _cache_client.aclose()
+    _cache_client = None
+    _cache_client_loop = None
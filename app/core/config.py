@@ -30,6 +30,13 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    # Fixed-size pool: bursts (e.g. logins) queue for a connection instead of
+    # opening overflow connections against the remote MySQL server
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 0
+    DB_POOL_RECYCLE: int = 1800
+    # Seconds a request waits for a free connection before failing
+    DB_POOL_TIMEOUT: int = 10
     
     # JWT Configuration
     JWT_SECRET: str
@@ -71,6 +78,11 @@ class Settings(BaseSettings):
     # Celery / Redis
     CELERY_BROKER_URL: str = "redis://redis:6379/0"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/1"
+    # Response cache for public menu reads; falls back to the database when
+    # disabled or when Redis is unreachable
+    CACHE_REDIS_URL: str = "redis://redis:6379/2"
+    MENU_CACHE_ENABLED: Annotated[bool, BeforeValidator(_parse_bool_env)] = True
+    MENU_CACHE_TTL_SECONDS: int = 3600
 
     # Platform Razorpay (SaaS subscription billing)
     RAZORPAY_KEY_ID: str | None = None
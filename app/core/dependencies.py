@@ -355,15 +355,8 @@ async def is_restaurant_admin(
 
     from app.modules.restaurant.model import RestaurantOwner
 
-    owner_result = await db.execute(
-        select(RestaurantOwner).where(
-            RestaurantOwner.restaurant_id == restaurant_id,
-            RestaurantOwner.user_id == user.id,
-            RestaurantOwner.is_active == True,
-        )
-    )
-    owner = owner_result.scalar_one_or_none()
-    if owner and owner.role in RESTAURANT_ADMIN_ROLES:
+    owner = await db.get(RestaurantOwner, (restaurant_id, user.id))
+    if owner and owner.is_active and owner.role in RESTAURANT_ADMIN_ROLES:
         return True
 
     if user.restaurant_id == restaurant_id and user.role in RESTAURANT_ADMIN_ROLES:
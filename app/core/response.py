@@ -1,10 +1,13 @@
+from functools import lru_cache
 from typing import Any, Optional, Dict
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ValidationError
 from datetime import datetime
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
+from app.core.config import settings
 from app.core.timezone import convert_datetime_fields, get_utc_now
 
 
@@ -47,7 +50,9 @@ def success_response(
     
     Args:
         message: Success message
-        data: Response data (can be dict, list, or any serializable object)
+        data: Response data (dict, list, pydantic model, or any serializable object).
+            A pydantic model is serialized once by pydantic-core instead of
+            being dumped and then walked again by jsonable_encoder.
         meta: Optional metadata (pagination info, etc.)
         status_code: HTTP status code (default: 200, use 201 for created)
         timezone: Optional timezone for datetime conversion (if None, returns UTC)
@@ -64,6 +69,14 @@ def success_response(
             "timestamp": "2024-01-01T12:00:00.000Z"
         }
     """
+    encoded_data = None
+    if isinstance(data, BaseModel):
+        if timezone:
+            # Timezone conversion works on datetime objects, so dump in python mode
+            data = data.model_dump()
+        else:
+            encoded_data = data.model_dump(mode="json")
+    
     # Convert datetime fields to restaurant timezone if specified
     if timezone and data:
         data = convert_datetime_fields(data, timezone)
@@ -72,7 +85,7 @@ def success_response(
         "success": True,
         "status_code": status_code,
         "message": message,
-        "data": jsonable_encoder(data),
+        "data": encoded_data if encoded_data is not None else jsonable_encoder(data),
         "error": None,
         "timestamp": get_utc_now().isoformat()
     }
@@ -83,6 +96,69 @@ def success_response(
     return JSONResponse(content=response, status_code=status_code)
 
 
+def orjson_success_response(
+    message: str,
+    data: Any = None,
+    meta: Optional[Dict[str, Any]] = None,
+    status_code: int = 200
+) -> ORJSONResponse:
+    """
+    Success response for large list payloads, serialized with orjson
+    
+    Same envelope as success_response, but data is handed to orjson as-is
+    instead of going through jsonable_encoder; it must already be plain
+    dicts/lists of values orjson understands (datetime, enum, UUID, ...).
+    """
+    response = {
+        "success": True,
+        "status_code": status_code,
+        "message": message,
+        "data": data,
+        "error": None,
+        "timestamp": get_utc_now().isoformat()
+    }
+    
+    if meta:
+        response["meta"] = meta
+    
+    return ORJSONResponse(content=response, status_code=status_code)
+
+
+@lru_cache(maxsize=256)
+def _success_prefix(message: str, status_code: int) -> bytes:
+    """Envelope bytes up to and including the ``"data":`` key."""
+    return b'{"success":true,"status_code":%d,"message":%s,"data":' % (
+        status_code, orjson.dumps(message)
+    )
+
+
+def raw_success_response(
+    message: str,
+    data_json: bytes,
+    meta: Optional[Dict[str, Any]] = None,
+    status_code: int = 200
+) -> Response:
+    """
+    Success response around an already JSON-encoded data payload
+    
+    Same envelope as success_response, but data_json is spliced in as-is, so
+    cached payloads are sent without being decoded and encoded again. The
+    envelope prefix for each message is built once and reused.
+    """
+    parts = [
+        _success_prefix(message, status_code),
+        data_json,
+        b',"error":null,"timestamp":',
+        orjson.dumps(get_utc_now().isoformat()),
+    ]
+    if meta:
+        parts.append(b',"meta":')
+        parts.append(orjson.dumps(meta))
+    parts.append(b"}")
+    
+    return Response(content=b"".join(parts), status_code=status_code, media_type="application/json")
+
+
 def error_response(
     message: str,
     error_code: str,
@@ -232,3 +308,26 @@ async def request_validation_exception_handler(
         status_code=422,
         content={"detail": jsonable_encoder(safe_detail)},
     )
+
+
+async def value_error_exception_handler(request: Request, exc: ValueError) -> JSONResponse:
+    """400 fallback for business-rule ``ValueError``s a route did not catch itself."""
+    if isinstance(exc, ValidationError):
+        # Pydantic failures past request validation are server bugs, not bad input
+        return await unhandled_exception_handler(request, exc)
+    return error_response(
+        message="Invalid operation",
+        error_code="INVALID_OPERATION",
+        error_details=str(exc),
+        status_code=400
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """500 fallback so uncaught errors still use the standard error envelope."""
+    return error_response(
+        message="Internal server error",
+        error_code="INTERNAL_ERROR",
+        error_details=str(exc) if settings.is_development else None,
+        status_code=500
+    )
@@ -1,6 +1,9 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from typing import Optional, Tuple
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
@@ -8,6 +11,14 @@ from app.core.config import settings
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so verifications run in parallel on these threads
+# while the event loop keeps serving other requests
+_PW_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="pwhash")
+
+# JWT key object built once; passing a string secret makes jose re-parse and
+# re-construct the key on every encode/decode
+_JWT_KEY = jwk.construct(settings.JWT_SECRET, settings.JWT_ALGORITHM)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -23,6 +34,21 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hash without blocking the event loop
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PW_POOL, verify_password, plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password
@@ -61,7 +87,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
+        _JWT_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     
@@ -88,13 +114,44 @@ def create_refresh_token(data: dict) -> str:
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.JWT_SECRET,
+        _JWT_KEY,
         algorithm=settings.JWT_ALGORITHM
     )
     
     return encoded_jwt
 
 
+def create_token_pair(data: dict) -> Tuple[str, str]:
+    """
+    Create an access and refresh token for the same subject
+    
+    Builds the shared claims and reads the clock once; the two tokens differ
+    only in their exp and type claims.
+    
+    Args:
+        data: Data to encode in both tokens
+        
+    Returns:
+        Tuple of (access_token, refresh_token)
+    """
+    now = datetime.utcnow()
+    access_claims = {
+        **data,
+        "exp": now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        "type": "access"
+    }
+    refresh_claims = {
+        **data,
+        "exp": now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        "type": "refresh"
+    }
+    
+    return (
+        jwt.encode(access_claims, _JWT_KEY, algorithm=settings.JWT_ALGORITHM),
+        jwt.encode(refresh_claims, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
+    )
+
+
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and verify JWT token
@@ -108,7 +165,7 @@ def decode_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET,
+            _JWT_KEY,
             algorithms=[settings.JWT_ALGORITHM]
         )
         return payload
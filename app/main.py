@@ -1,15 +1,17 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.logging_config import configure_customer_auth_logging
-from app.core.database import init_db, close_db
+from app.core.database import init_db, warm_db_pool, close_db
 from app.core.response import (
     success_response,
     request_validation_exception_handler,
+    value_error_exception_handler,
+    unhandled_exception_handler,
 )
 from app.modules.auth.route import router as auth_router
 from app.modules.user.route import router as user_router
@@ -37,6 +39,8 @@ from app.modules.billing.route import router as billing_router
 from app.routes.upload import router as upload_router
 from app.services.storage_service import init_storage
 from app.modules.restaurant.seed import run_seed_subscription_plans
+from app.modules.auth.service import start_login_log_flusher, stop_login_log_flusher
+from app.core.cache import close_cache_client
 
 
 @asynccontextmanager
@@ -57,6 +61,8 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await init_db()
     print("✅ Database initialized")
+    await warm_db_pool()
+    print(f"✅ Database pool warmed ({settings.DB_POOL_SIZE} connections)")
 
     await run_seed_subscription_plans()
     print("✅ Subscription plans seeded")
@@ -64,11 +70,17 @@ async def lifespan(app: FastAPI):
     # Initialize MinIO storage (client + bucket)
     init_storage()
     print("✅ MinIO storage initialized")
+
+    start_login_log_flusher()
+    print("✅ Login log flusher started")
     
     yield
     
     # Shutdown
     print("🛑 Shutting down application...")
+    await stop_login_log_flusher()
+    print("✅ Login logs flushed")
+    await close_cache_client()
     await close_db()
     print("✅ Database connections closed")
 
@@ -79,6 +91,9 @@ app = FastAPI(
     description="Point of Sale System API with JWT Authentication",
     version="1.0.0",
     lifespan=lifespan,
+    # Routes that return plain dicts/models are encoded with orjson; explicit
+    # JSONResponse envelopes (success_response etc.) are passed through as-is
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url=None,
     servers=[
@@ -96,6 +111,9 @@ app.add_middleware(
 )
 
 app.add_exception_handler(RequestValidationError, request_validation_exception_handler)
+# Fallbacks for errors a route does not translate itself
+app.add_exception_handler(ValueError, value_error_exception_handler)
+app.add_exception_handler(Exception, unhandled_exception_handler)
 
 
 # Health check endpoint
@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean, DateTime, Integer, Text, Enum as SQLEnum
+from sqlalchemy import String, Boolean, DateTime, Integer, Text, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime, timedelta
 from typing import Optional
@@ -26,14 +26,24 @@ class LoginLog(Base):
     """Login log database model"""
     
     __tablename__ = "login_logs"
+    __table_args__ = (
+        # Covers get_user_and_failed_attempts: the lockout count is answered from the index
+        Index("ix_login_logs_email_status_attempted_at", "email", "status", "attempted_at"),
+        # Listing queries filter on one column and ORDER BY attempted_at DESC;
+        # InnoDB scans these backwards, so no DESC key parts are needed. They also
+        # serve plain email/user_id lookups, so those columns have no own index.
+        Index("ix_login_logs_email_attempted_at", "email", "attempted_at"),
+        Index("ix_login_logs_user_id_attempted_at", "user_id", "attempted_at"),
+        Index("ix_login_logs_is_suspicious_attempted_at", "is_suspicious", "attempted_at"),
+    )
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Mandatory fields
-    email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     ip_address: Mapped[str] = mapped_column(String(45), nullable=False)  # IPv6 max length
     device_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    attempted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    attempted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     
     # Status and reason
     status: Mapped[LoginAttemptStatus] = mapped_column(
@@ -48,7 +58,7 @@ class LoginLog(Base):
     )
     
     # Additional fields
-    user_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True, index=True)  # Null if login failed
+    user_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # Null if login failed
     user_agent: Mapped[str] = mapped_column(Text, nullable=True)  # Full user agent string
     browser: Mapped[str] = mapped_column(String(100), nullable=True)
     operating_system: Mapped[str] = mapped_column(String(100), nullable=True)
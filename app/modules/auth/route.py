@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, status, Request, Form, Body
+import re
+from datetime import datetime
+from functools import lru_cache
+from fastapi import APIRouter, BackgroundTasks, Depends, status, Request, Form, Body
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
-from app.core.response import success_response, error_response
+from app.core.response import success_response, orjson_success_response, error_response
 from app.modules.auth.schema import (
     LoginRequest,
     TokenResponse,
@@ -13,73 +17,158 @@ from app.modules.auth.schema import (
     ResetPasswordRequest,
     LoginLogResponse
 )
-from app.modules.auth.service import AuthService, LoginLogService, PasswordResetService, send_password_reset_email
+from app.modules.auth.service import BOT_DEVICE_TYPE, AuthService, LoginLogService, PasswordResetService, send_password_reset_email
 from app.modules.user.model import User
 from app.modules.user.service import UserService
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Serializes a whole list of LoginLog rows in one pydantic-core call
+_LOG_LIST_ADAPTER = TypeAdapter(List[LoginLogResponse])
+
+
+def _next_log_cursor(logs: list, limit: int) -> Optional[dict]:
+    """Keyset cursor for the page after `logs`, or None on the last page"""
+    if not logs or len(logs) < limit:
+        return None
+    last = logs[-1]
+    return {"before": last.attempted_at, "before_id": last.id}
+
+
+def _log_cursor_error(skip: int, before: Optional[datetime], before_id: Optional[int]):
+    """422 response for a half-sent keyset cursor or a cursor combined with skip, else None"""
+    if (before is None) != (before_id is None):
+        details = "before and before_id must be sent together"
+    elif before is not None and skip:
+        details = "skip cannot be combined with the before/before_id cursor"
+    else:
+        return None
+    return error_response(
+        message="Invalid pagination cursor",
+        error_code="VALIDATION_ERROR",
+        error_details=details,
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+
 
 def get_client_ip(request: Request) -> str:
     """Extract client IP address from request"""
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        return forwarded.partition(",")[0].strip() or "unknown"
     return request.client.host if request.client else "unknown"
 
 
-def get_device_type(user_agent: str) -> str:
-    """Determine device type from user agent"""
-    user_agent_lower = user_agent.lower()
-    
-    if "mobile" in user_agent_lower or "android" in user_agent_lower or "iphone" in user_agent_lower:
-        return "mobile"
-    elif "tablet" in user_agent_lower or "ipad" in user_agent_lower:
-        return "tablet"
-    else:
-        return "desktop"
+_UA_BROWSER_EDGE = 1
+_UA_BROWSER_CHROME = 2
+_UA_BROWSER_FIREFOX = 4
+_UA_BROWSER_SAFARI = 8
+_UA_BROWSER_OPERA = 16
+_UA_OS_WINDOWS = 32
+_UA_OS_MAC = 64
+_UA_OS_LINUX = 128
+_UA_OS_ANDROID = 256
+_UA_OS_IOS = 512
+_UA_DEVICE_MOBILE = 1024
+_UA_DEVICE_TABLET = 2048
+
+_UA_TOKEN_FLAGS = {
+    "edg": _UA_BROWSER_EDGE,
+    "chrome": _UA_BROWSER_CHROME,
+    "firefox": _UA_BROWSER_FIREFOX,
+    "safari": _UA_BROWSER_SAFARI,
+    "opr": _UA_BROWSER_OPERA,
+    "opera": _UA_BROWSER_OPERA,
+    "windows": _UA_OS_WINDOWS,
+    "mac": _UA_OS_MAC,
+    "linux": _UA_OS_LINUX,
+    "android": _UA_OS_ANDROID | _UA_DEVICE_MOBILE,
+    "iphone": _UA_OS_IOS | _UA_DEVICE_MOBILE,
+    "ipad": _UA_OS_IOS | _UA_DEVICE_TABLET,
+    "mobile": _UA_DEVICE_MOBILE,
+    "tablet": _UA_DEVICE_TABLET,
+}
+
+# Cheap substring gate: agents with none of these tokens (curl, SDKs, bots) skip the regex
+_UA_GATE = tuple(_UA_TOKEN_FLAGS)
+
+# Single alternation over every token we care about, scanned once over the lower-cased agent
+_UA_RE = re.compile("|".join(_UA_TOKEN_FLAGS))
+
+_UA_DEFAULT = ("desktop", "unknown", "unknown")
 
+# Crawlers are checked before anything else and never reach the browser/OS parsing.
+# "bot" must end a product token (Googlebot/2.1, AdsBot-Google, "compatible; bot;")
+# so device names that merely contain it, like CUBOT phones, are not flagged.
+_UA_BOT_RE = re.compile(r"bot[/;)\-]|\bbot\b|crawler|spider")
+_UA_BOT = (BOT_DEVICE_TYPE, BOT_DEVICE_TYPE, BOT_DEVICE_TYPE)
 
-def parse_user_agent(user_agent: str) -> dict:
-    """Parse user agent to extract browser and OS"""
+
+@lru_cache(maxsize=4096)
+def parse_ua(user_agent: str) -> Tuple[str, str, str]:
+    """
+    Parse a user agent into (device_type, browser, operating_system)
+    
+    Cached per raw UA string: real traffic repeats a small set of agents.
+    Crawlers (bot tokens, crawler, spider) short-circuit to ("bot", "bot", "bot").
+    
+    Precedence matches the original substring checks: Chrome only when not Edge,
+    Safari only when not Chrome, and desktop/macOS/Linux take priority the same way.
+    """
     user_agent_lower = user_agent.lower()
+    if _UA_BOT_RE.search(user_agent_lower):
+        return _UA_BOT
+    if not any(token in user_agent_lower for token in _UA_GATE):
+        return _UA_DEFAULT
+    
+    mask = 0
+    for match in _UA_RE.finditer(user_agent_lower):
+        mask |= _UA_TOKEN_FLAGS[match.group()]
+    
+    # Detect device
+    if mask & _UA_DEVICE_MOBILE:
+        device_type = "mobile"
+    elif mask & _UA_DEVICE_TABLET:
+        device_type = "tablet"
+    else:
+        device_type = "desktop"
     
     # Detect browser
-    browser = "unknown"
-    if "chrome" in user_agent_lower and "edg" not in user_agent_lower:
+    if mask & _UA_BROWSER_CHROME and not mask & _UA_BROWSER_EDGE:
         browser = "Chrome"
-    elif "firefox" in user_agent_lower:
+    elif mask & _UA_BROWSER_FIREFOX:
         browser = "Firefox"
-    elif "safari" in user_agent_lower and "chrome" not in user_agent_lower:
+    elif mask & _UA_BROWSER_SAFARI and not mask & _UA_BROWSER_CHROME:
         browser = "Safari"
-    elif "edg" in user_agent_lower:
+    elif mask & _UA_BROWSER_EDGE:
         browser = "Edge"
-    elif "opera" in user_agent_lower or "opr" in user_agent_lower:
+    elif mask & _UA_BROWSER_OPERA:
         browser = "Opera"
+    else:
+        browser = "unknown"
     
     # Detect OS
-    operating_system = "unknown"
-    if "windows" in user_agent_lower:
+    if mask & _UA_OS_WINDOWS:
         operating_system = "Windows"
-    elif "mac" in user_agent_lower:
+    elif mask & _UA_OS_MAC:
         operating_system = "macOS"
-    elif "linux" in user_agent_lower:
+    elif mask & _UA_OS_LINUX:
         operating_system = "Linux"
-    elif "android" in user_agent_lower:
+    elif mask & _UA_OS_ANDROID:
         operating_system = "Android"
-    elif "iphone" in user_agent_lower or "ipad" in user_agent_lower:
+    elif mask & _UA_OS_IOS:
         operating_system = "iOS"
+    else:
+        operating_system = "unknown"
     
-    return {
-        "browser": browser,
-        "operating_system": operating_system
-    }
+    return device_type, browser, operating_system
 
 
 @router.post("/login", response_model=None)
 async def login(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -154,8 +243,7 @@ async def login(
         # Extract request metadata
         ip_address = get_client_ip(request)
         user_agent = request.headers.get("User-Agent", "unknown")
-        device_type = get_device_type(user_agent)
-        parsed_ua = parse_user_agent(user_agent)
+        device_type, browser, operating_system = parse_ua(user_agent)
         
         tokens = await AuthService.login(
             db,
@@ -164,8 +252,9 @@ async def login(
             ip_address=ip_address,
             device_type=device_type,
             user_agent=user_agent,
-            browser=parsed_ua["browser"],
-            operating_system=parsed_ua["operating_system"]
+            browser=browser,
+            operating_system=operating_system,
+            background_tasks=background_tasks
         )
         
         if not tokens:
@@ -225,6 +314,7 @@ async def refresh_token(
 async def forgot_password(
     forgot_data: ForgotPasswordRequest,
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -259,15 +349,16 @@ async def forgot_password(
 
         # Also log the forgot-password attempt
         user_agent = request.headers.get("User-Agent", "unknown")
-        device_type = get_device_type(user_agent)
-        parsed_ua = parse_user_agent(user_agent)
+        device_type, browser, operating_system = parse_ua(user_agent)
         await AuthService.log_forgot_password(
             db, forgot_data.email,
             ip_address=ip_address,
             device_type=device_type,
             user_agent=user_agent,
-            browser=parsed_ua["browser"],
-            operating_system=parsed_ua["operating_system"]
+            browser=browser,
+            operating_system=operating_system,
+            background_tasks=background_tasks,
+            user_id=user.id
         )
 
         return success_response(
@@ -355,22 +446,34 @@ async def logout():
 async def get_my_login_logs(
     skip: int = 0,
     limit: int = 50,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get login logs for current authenticated user
     
-    - **skip**: Number of records to skip (pagination)
+    - **skip**: Number of records to skip (pagination, not combinable with the cursor)
     - **limit**: Maximum number of records to return
+    - **before** / **before_id**: Keyset cursor from the previous page's `meta.next_cursor`, sent together
     """
+    cursor_error = _log_cursor_error(skip, before, before_id)
+    if cursor_error is not None:
+        return cursor_error
+    
     try:
-        logs = await LoginLogService.get_logs_by_user_id(db, current_user.id, skip=skip, limit=limit)
-        logs_data = [LoginLogResponse.model_validate(log).model_dump() for log in logs]
+        logs = await LoginLogService.get_logs_by_user_id(
+            db, current_user.id, skip=skip, limit=limit, before=before, before_id=before_id
+        )
+        logs_data = _LOG_LIST_ADAPTER.dump_python(
+            _LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
+        )
         
-        return success_response(
+        return orjson_success_response(
             message="Login logs retrieved successfully",
-            data=logs_data
+            data=logs_data,
+            meta={"next_cursor": _next_log_cursor(logs, limit)}
         )
     except Exception as e:
         return error_response(
@@ -385,6 +488,8 @@ async def get_login_logs_by_email(
     email: str,
     skip: int = 0,
     limit: int = 50,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -392,9 +497,14 @@ async def get_login_logs_by_email(
     Get login logs for a specific email (requires authentication)
     
     - **email**: Email address to query
-    - **skip**: Number of records to skip (pagination)
+    - **skip**: Number of records to skip (pagination, not combinable with the cursor)
     - **limit**: Maximum number of records to return
+    - **before** / **before_id**: Keyset cursor from the previous page's `meta.next_cursor`, sent together
     """
+    cursor_error = _log_cursor_error(skip, before, before_id)
+    if cursor_error is not None:
+        return cursor_error
+    
     try:
         # Only allow superusers or the user themselves to view logs
         if not current_user.is_superuser and current_user.email != email:
@@ -404,12 +514,17 @@ async def get_login_logs_by_email(
                 error_details="You can only view your own login logs"
             )
         
-        logs = await LoginLogService.get_logs_by_email(db, email, skip=skip, limit=limit)
-        logs_data = [LoginLogResponse.model_validate(log).model_dump() for log in logs]
+        logs = await LoginLogService.get_logs_by_email(
+            db, email, skip=skip, limit=limit, before=before, before_id=before_id
+        )
+        logs_data = _LOG_LIST_ADAPTER.dump_python(
+            _LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
+        )
         
-        return success_response(
+        return orjson_success_response(
             message="Login logs retrieved successfully",
-            data=logs_data
+            data=logs_data,
+            meta={"next_cursor": _next_log_cursor(logs, limit)}
         )
     except Exception as e:
         return error_response(
@@ -423,15 +538,22 @@ async def get_login_logs_by_email(
 async def get_suspicious_login_logs(
     skip: int = 0,
     limit: int = 50,
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get suspicious login attempts (superuser only)
     
-    - **skip**: Number of records to skip (pagination)
+    - **skip**: Number of records to skip (pagination, not combinable with the cursor)
     - **limit**: Maximum number of records to return
+    - **before** / **before_id**: Keyset cursor from the previous page's `meta.next_cursor`, sent together
     """
+    cursor_error = _log_cursor_error(skip, before, before_id)
+    if cursor_error is not None:
+        return cursor_error
+    
     try:
         if not current_user.is_superuser:
             return error_response(
@@ -440,12 +562,17 @@ async def get_suspicious_login_logs(
                 error_details="Only superusers can view suspicious login logs"
             )
         
-        logs = await LoginLogService.get_suspicious_logs(db, skip=skip, limit=limit)
-        logs_data = [LoginLogResponse.model_validate(log).model_dump() for log in logs]
+        logs = await LoginLogService.get_suspicious_logs(
+            db, skip=skip, limit=limit, before=before, before_id=before_id
+        )
+        logs_data = _LOG_LIST_ADAPTER.dump_python(
+            _LOG_LIST_ADAPTER.validate_python(logs, from_attributes=True)
+        )
         
-        return success_response(
+        return orjson_success_response(
             message="Suspicious login logs retrieved successfully",
-            data=logs_data
+            data=logs_data,
+            meta={"next_cursor": _next_log_cursor(logs, limit)}
         )
     except Exception as e:
         return error_response(
@@ -5,23 +5,100 @@ import smtplib
 import ssl
 from email.message import EmailMessage
 from email.utils import formataddr
+from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
-from typing import Optional, Dict, List
-from datetime import datetime, timedelta
+from sqlalchemy import select, desc, func, insert, bindparam, literal, Row, and_, or_
+from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
 from app.modules.user.service import UserService
-from app.core.security import create_access_token, create_refresh_token, decode_token, get_password_hash, verify_password
-from app.modules.user.model import User
+from app.core.security import create_access_token, create_token_pair, decode_token, get_password_hash, verify_password_async
+from app.modules.user.model import User, email_lookup_hash
 from app.modules.auth.model import LoginLog, LoginAttemptStatus, LoginAttemptFailureReason, PasswordResetOTP
-from app.modules.auth.schema import LoginLogCreate
+from app.modules.auth.schema import LoginLogCreate, LoginLogResponse
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
 
+# device_type reported by the route for crawler user agents
+BOT_DEVICE_TYPE = "bot"
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, matching the naive UTC DATETIME columns (utcnow() is deprecated)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Columns needed to render LoginLogResponse. Log listings select these as plain
+# rows instead of hydrating LoginLog instances into the identity map.
+LOGIN_LOG_LIST_COLUMNS = tuple(getattr(LoginLog, name) for name in LoginLogResponse.model_fields)
+
+# Hot login-log queries are built once and executed with bound parameters, so
+# each request skips statement construction and cache-key generation and goes
+# straight to the engine's compiled cache.
+_LOGS_PAGE = (
+    select(*LOGIN_LOG_LIST_COLUMNS)
+    .order_by(desc(LoginLog.attempted_at), desc(LoginLog.id))
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# Keyset cursor: rows strictly after (before, before_id) in the listing order.
+# id breaks ties because DATETIME only has second precision.
+_BEFORE_CURSOR = or_(
+    LoginLog.attempted_at < bindparam("before"),
+    and_(LoginLog.attempted_at == bindparam("before"), LoginLog.id < bindparam("before_id"))
+)
+_LOGS_BY_EMAIL = _LOGS_PAGE.where(LoginLog.email == bindparam("email"))
+_LOGS_BY_USER_ID = _LOGS_PAGE.where(LoginLog.user_id == bindparam("user_id"))
+_SUSPICIOUS_LOGS = _LOGS_PAGE.where(LoginLog.is_suspicious == True)
+_LOGS_BY_EMAIL_BEFORE = _LOGS_BY_EMAIL.where(_BEFORE_CURSOR)
+_LOGS_BY_USER_ID_BEFORE = _LOGS_BY_USER_ID.where(_BEFORE_CURSOR)
+_SUSPICIOUS_LOGS_BEFORE = _SUSPICIOUS_LOGS.where(_BEFORE_CURSOR)
+_FAILED_ATTEMPTS_COUNT = (
+    select(func.count())
+    .select_from(LoginLog)
+    .where(
+        LoginLog.email == bindparam("email"),
+        LoginLog.status == LoginAttemptStatus.FAILED,
+        LoginLog.attempted_at >= bindparam("since")
+    )
+)
+# The login path's user lookup with the lockout count alongside. Users are
+# LEFT JOINed onto a one-row anchor so unknown emails still get a count.
+_USER_AND_FAILED_ATTEMPTS = (
+    select(User, _FAILED_ATTEMPTS_COUNT.scalar_subquery().label("failed"))
+    .select_from(select(literal(1).label("one")).subquery())
+    .outerjoin(
+        User,
+        and_(User.email_hash == bindparam("email_hash"), User.email == bindparam("email"))
+    )
+)
+
+
 class LoginLogService:
     """Service layer for login log operations"""
     
+    @staticmethod
+    async def _fetch_page(
+        db: AsyncSession,
+        stmt,
+        keyset_stmt,
+        params: dict,
+        skip: int,
+        limit: int,
+        before: Optional[datetime],
+        before_id: Optional[int]
+    ) -> List[Row]:
+        """Run a listing query, seeking past the (before, before_id) cursor when given"""
+        params = {**params, "skip": skip, "limit": limit}
+        if before is not None:
+            stmt = keyset_stmt
+            params["before"] = before
+            params["before_id"] = before_id
+        result = await db.execute(stmt, params)
+        return list(result.all())
+    
     @staticmethod
     async def create_log(db: AsyncSession, log_data: LoginLogCreate) -> LoginLog:
         """
@@ -50,8 +127,9 @@ class LoginLogService:
         )
         
         db.add(db_log)
+        # id comes back from the INSERT and attempted_at is a Python-side default;
+        # with expire_on_commit=False nothing needs reloading.
         await db.commit()
-        await db.refresh(db_log)
         
         return db_log
     
@@ -60,8 +138,10 @@ class LoginLogService:
         db: AsyncSession,
         email: str,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[LoginLog]:
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> List[Row]:
         """
         Get login logs for a specific email
         
@@ -70,26 +150,25 @@ class LoginLogService:
             email: User email
             skip: Number of records to skip
             limit: Maximum number of records to return
+            before: Cursor from the previous page's last attempted_at (keyset pagination)
+            before_id: Cursor from the previous page's last id, breaks attempted_at ties
             
         Returns:
-            List of login logs
+            List of login log rows
         """
-        result = await db.execute(
-            select(LoginLog)
-            .where(LoginLog.email == email)
-            .order_by(desc(LoginLog.attempted_at))
-            .offset(skip)
-            .limit(limit)
+        return await LoginLogService._fetch_page(
+            db, _LOGS_BY_EMAIL, _LOGS_BY_EMAIL_BEFORE, {"email": email}, skip, limit, before, before_id
         )
-        return list(result.scalars().all())
     
     @staticmethod
     async def get_logs_by_user_id(
         db: AsyncSession,
         user_id: str,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[LoginLog]:
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> List[Row]:
         """
         Get login logs for a specific user
         
@@ -98,27 +177,27 @@ class LoginLogService:
             user_id: User ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            before: Cursor from the previous page's last attempted_at (keyset pagination)
+            before_id: Cursor from the previous page's last id, breaks attempted_at ties
             
         Returns:
-            List of login logs
+            List of login log rows
         """
-        result = await db.execute(
-            select(LoginLog)
-            .where(LoginLog.user_id == user_id)
-            .order_by(desc(LoginLog.attempted_at))
-            .offset(skip)
-            .limit(limit)
+        return await LoginLogService._fetch_page(
+            db, _LOGS_BY_USER_ID, _LOGS_BY_USER_ID_BEFORE, {"user_id": user_id}, skip, limit, before, before_id
         )
-        return list(result.scalars().all())
     
     @staticmethod
-    async def get_failed_attempts(
+    async def get_user_and_failed_attempts(
         db: AsyncSession,
         email: str,
         since_minutes: int = 30
-    ) -> int:
+    ) -> Tuple[Optional[User], int]:
         """
-        Count failed login attempts for an email in the last X minutes
+        Get the user for an email and its failed login attempts in the last X minutes
+        
+        Both come back from one statement so the login path pays a single
+        round-trip. The count is returned even when no user matches.
         
         Args:
             db: Database session
@@ -126,27 +205,25 @@ class LoginLogService:
             since_minutes: Time window in minutes
             
         Returns:
-            Number of failed attempts
+            Tuple of (user or None, number of failed attempts)
         """
-        since_time = datetime.utcnow() - timedelta(minutes=since_minutes)
+        since_time = _utcnow() - timedelta(minutes=since_minutes)
         
         result = await db.execute(
-            select(LoginLog)
-            .where(
-                LoginLog.email == email,
-                LoginLog.status == LoginAttemptStatus.FAILED,
-                LoginLog.attempted_at >= since_time
-            )
+            _USER_AND_FAILED_ATTEMPTS,
+            {"email": email, "email_hash": email_lookup_hash(email), "since": since_time}
         )
-        
-        return len(list(result.scalars().all()))
+        user, failed = result.one()
+        return user, failed
     
     @staticmethod
     async def get_suspicious_logs(
         db: AsyncSession,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[LoginLog]:
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> List[Row]:
         """
         Get suspicious login attempts
         
@@ -154,23 +231,135 @@ class LoginLogService:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
+            before: Cursor from the previous page's last attempted_at (keyset pagination)
+            before_id: Cursor from the previous page's last id, breaks attempted_at ties
             
         Returns:
-            List of suspicious login logs
+            List of suspicious login log rows
         """
-        result = await db.execute(
-            select(LoginLog)
-            .where(LoginLog.is_suspicious == True)
-            .order_by(desc(LoginLog.attempted_at))
-            .offset(skip)
-            .limit(limit)
+        return await LoginLogService._fetch_page(
+            db, _SUSPICIOUS_LOGS, _SUSPICIOUS_LOGS_BEFORE, {}, skip, limit, before, before_id
         )
-        return list(result.scalars().all())
+
+
+async def persist_login_log(log_data: LoginLogCreate) -> None:
+    """Write a login log in its own session; runs after the response is sent."""
+    try:
+        async with AsyncSessionLocal() as db:
+            await LoginLogService.create_log(db, log_data)
+    except Exception:
+        logger.exception("Failed to write login log for %s", log_data.email)
+
+
+# Buffered login-log writes: rows are queued per request and a single flusher
+# task inserts them in batches, so N logins cost one INSERT + COMMIT. Failed
+# attempts bypass the queue because the lockout count reads them back.
+LOGIN_LOG_FLUSH_INTERVAL = 0.5  # seconds
+LOGIN_LOG_BATCH_SIZE = 200
+
+_LOG_QUEUE: "asyncio.Queue[Optional[dict]]" = asyncio.Queue()
+_log_flusher_task: Optional["asyncio.Task[None]"] = None
+
+
+def enqueue_login_log(log_data: LoginLogCreate) -> bool:
+    """
+    Queue a login log for the batch flusher.
+
+    Returns:
+        False if the flusher is not running and the caller must write the row itself
+    """
+    if _log_flusher_task is None or _log_flusher_task.done():
+        return False
+    row = log_data.model_dump()
+    row["attempted_at"] = _utcnow()
+    _LOG_QUEUE.put_nowait(row)
+    return True
+
+
+async def _flush_login_logs(batch: List[dict]) -> None:
+    """Insert a batch of queued login logs in one statement and one commit"""
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(LoginLog), batch)
+            await db.commit()
+    except Exception:
+        logger.exception("Failed to flush %d login logs", len(batch))
+
+
+async def _login_log_flusher() -> None:
+    """Drain the queue every LOGIN_LOG_FLUSH_INTERVAL or LOGIN_LOG_BATCH_SIZE rows"""
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        row = await _LOG_QUEUE.get()
+        if row is None:
+            break
+        batch = [row]
+        deadline = loop.time() + LOGIN_LOG_FLUSH_INTERVAL
+        while len(batch) < LOGIN_LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                row = await asyncio.wait_for(_LOG_QUEUE.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if row is None:
+                # Shutdown sentinel: flush what is buffered, then exit
+                stopping = True
+                break
+            batch.append(row)
+        await _flush_login_logs(batch)
+
+
+def start_login_log_flusher() -> None:
+    """Start the background login-log flusher (called from the app lifespan)"""
+    global _log_flusher_task
+    if _log_flusher_task is None or _log_flusher_task.done():
+        _log_flusher_task = asyncio.create_task(_login_log_flusher())
+
+
+async def stop_login_log_flusher() -> None:
+    """Flush pending login logs and stop the flusher"""
+    global _log_flusher_task
+    if _log_flusher_task is None:
+        return
+    task, _log_flusher_task = _log_flusher_task, None
+    if not task.done():
+        _LOG_QUEUE.put_nowait(None)
+        await task
 
 
 class AuthService:
     """Service layer for authentication operations"""
     
+    @staticmethod
+    async def _record_log(
+        db: AsyncSession,
+        log_data: LoginLogCreate,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
+        """
+        Persist a login log via the batch flusher, a background task, or inline
+
+        Failed attempts are always written inline: the lockout check counts
+        them, so they must be in the database before the response goes out.
+        """
+        if log_data.device_type == BOT_DEVICE_TYPE:
+            # Crawler traffic: keep the raw agent, skip the parsed columns, flag it
+            log_data = log_data.model_copy(
+                update={"browser": None, "operating_system": None, "is_suspicious": True}
+            )
+        if log_data.status == LoginAttemptStatus.FAILED:
+            await LoginLogService.create_log(db, log_data)
+            return
+        if enqueue_login_log(log_data):
+            return
+        if background_tasks is not None:
+            background_tasks.add_task(persist_login_log, log_data)
+        else:
+            await LoginLogService.create_log(db, log_data)
+    
     @staticmethod
     async def login(
         db: AsyncSession,
@@ -180,7 +369,8 @@ class AuthService:
         device_type: str,
         user_agent: Optional[str] = None,
         browser: Optional[str] = None,
-        operating_system: Optional[str] = None
+        operating_system: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Optional[Dict[str, str]]:
         """
         Authenticate user and generate tokens with login logging
@@ -194,15 +384,18 @@ class AuthService:
             user_agent: Full user agent string
             browser: Browser name
             operating_system: Operating system name
+            background_tasks: When given, non-failure log rows are written after the response
             
         Returns:
             Dictionary with access_token and refresh_token, or None if authentication fails
         """
+        # Fetch the user and the recent failed-attempt count in one round-trip
+        user, failed_attempts = await LoginLogService.get_user_and_failed_attempts(db, email)
+        
         # Check for too many failed attempts
-        failed_attempts = await LoginLogService.get_failed_attempts(db, email, since_minutes=30)
         if failed_attempts >= 5:
             # Log suspicious activity
-            await LoginLogService.create_log(
+            await AuthService._record_log(
                 db,
                 LoginLogCreate(
                     email=email,
@@ -215,24 +408,20 @@ class AuthService:
                     operating_system=operating_system,
                     is_suspicious=True,
                     notes="Too many failed login attempts"
-                )
+                ),
+                background_tasks
             )
             return None
         
-        # Try to authenticate
-        user = await UserService.authenticate_user(db, email, password)
-        
-        if not user:
-            # Check if email exists to determine failure reason
-            existing_user = await UserService.get_user_by_email(db, email)
-            
-            if not existing_user:
+        # Verify the password against the row we already have
+        if not user or not await verify_password_async(password, user.hashed_password):
+            if not user:
                 failure_reason = LoginAttemptFailureReason.INVALID_EMAIL
             else:
                 failure_reason = LoginAttemptFailureReason.INVALID_PASSWORD
             
             # Log failed attempt
-            await LoginLogService.create_log(
+            await AuthService._record_log(
                 db,
                 LoginLogCreate(
                     email=email,
@@ -244,13 +433,18 @@ class AuthService:
                     browser=browser,
                     operating_system=operating_system,
                     is_suspicious=failed_attempts >= 3
-                )
+                ),
+                background_tasks
             )
             return None
         
+        # Update last login timestamp
+        user.last_login = _utcnow()
+        await db.commit()
+        
         if not user.is_active:
             # Log inactive account attempt
-            await LoginLogService.create_log(
+            await AuthService._record_log(
                 db,
                 LoginLogCreate(
                     email=email,
@@ -262,16 +456,16 @@ class AuthService:
                     user_agent=user_agent,
                     browser=browser,
                     operating_system=operating_system
-                )
+                ),
+                background_tasks
             )
             return None
         
         # Create tokens
-        access_token = create_access_token(data={"sub": user.id})
-        refresh_token = create_refresh_token(data={"sub": user.id})
+        access_token, refresh_token = create_token_pair({"sub": user.id})
         
         # Log successful login
-        await LoginLogService.create_log(
+        await AuthService._record_log(
             db,
             LoginLogCreate(
                 email=email,
@@ -283,7 +477,8 @@ class AuthService:
                 user_agent=user_agent,
                 browser=browser,
                 operating_system=operating_system
-            )
+            ),
+            background_tasks
         )
         
         return {
@@ -300,7 +495,9 @@ class AuthService:
         device_type: str,
         user_agent: Optional[str] = None,
         browser: Optional[str] = None,
-        operating_system: Optional[str] = None
+        operating_system: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+        user_id: Optional[str] = None
     ) -> None:
         """
         Log forgot password attempt
@@ -313,10 +510,14 @@ class AuthService:
             user_agent: Full user agent string
             browser: Browser name
             operating_system: Operating system name
+            background_tasks: When given, the log row is written after the response
+            user_id: ID of the already-loaded user; looked up by email when omitted
         """
-        user = await UserService.get_user_by_email(db, email)
+        if user_id is None:
+            user = await UserService.get_user_by_email(db, email)
+            user_id = user.id if user else None
         
-        await LoginLogService.create_log(
+        await AuthService._record_log(
             db,
             LoginLogCreate(
                 email=email,
@@ -324,11 +525,12 @@ class AuthService:
                 device_type=device_type,
                 status=LoginAttemptStatus.FORGOT_PASSWORD,
                 failure_reason=LoginAttemptFailureReason.NONE,
-                user_id=user.id if user else None,
+                user_id=user_id,
                 user_agent=user_agent,
                 browser=browser,
                 operating_system=operating_system
-            )
+            ),
+            background_tasks
         )
     
     @staticmethod
@@ -356,13 +558,12 @@ class AuthService:
         if not user_id:
             return None
         
-        # Verify user exists and is active
-        user = await UserService.get_user_by_id(db, user_id)
-        if not user or not user.is_active:
+        # Verify user exists and is active (no need to load the full row)
+        if not await UserService.get_active_flag(db, user_id):
             return None
         
         # Create new access token
-        access_token = create_access_token(data={"sub": user.id})
+        access_token = create_access_token(data={"sub": user_id})
         
         return {
             "access_token": access_token,
@@ -513,7 +714,7 @@ class PasswordResetService:
         Enforces a 60-second resend cooldown.
         Returns (otp_plain, expires_in_seconds).
         """
-        now = datetime.utcnow()
+        now = _utcnow()
 
         # Rate-limit check
         result = await db.execute(
@@ -550,7 +751,7 @@ class PasswordResetService:
         Verify OTP without consuming it (pre-check). Returns True if valid.
         Raises ValueError on invalid/expired OTP.
         """
-        now = datetime.utcnow()
+        now = _utcnow()
         result = await db.execute(
             select(PasswordResetOTP)
             .where(
@@ -568,7 +769,7 @@ class PasswordResetService:
         if record.attempts >= PasswordResetOTP.MAX_ATTEMPTS:
             raise ValueError("Too many invalid attempts. Please request a new OTP.")
 
-        if not verify_password(otp, record.otp_hash):
+        if not await verify_password_async(otp, record.otp_hash):
             record.attempts += 1
             await db.commit()
             remaining = PasswordResetOTP.MAX_ATTEMPTS - record.attempts
@@ -582,7 +783,7 @@ class PasswordResetService:
         Verify OTP, consume it, and update user's password.
         Returns the updated User on success.
         """
-        now = datetime.utcnow()
+        now = _utcnow()
         result = await db.execute(
             select(PasswordResetOTP)
             .where(
@@ -600,7 +801,7 @@ class PasswordResetService:
         if record.attempts >= PasswordResetOTP.MAX_ATTEMPTS:
             raise ValueError("Too many invalid attempts. Please request a new OTP.")
 
-        if not verify_password(otp, record.otp_hash):
+        if not await verify_password_async(otp, record.otp_hash):
             record.attempts += 1
             await db.commit()
             remaining = PasswordResetOTP.MAX_ATTEMPTS - record.attempts
@@ -110,27 +110,28 @@ class CartService:
 
         unit_price = 0
         if item_type == CartItemType.PRODUCT:
-            product = await db.scalar(
-                select(Product).where(
+            # Only the price is needed; skip the wide description/JSON columns
+            price = await db.scalar(
+                select(Product.price).where(
                     Product.id == product_id,
                     Product.restaurant_id == restaurant_id,
                     Product.available == True,
                 )
             )
-            if not product:
+            if price is None:
                 raise CartValidationError("Product not found", field="product_id")
-            unit_price = int(product.price or 0)
+            unit_price = int(price)
         elif item_type == CartItemType.COMBO_PRODUCT:
-            combo = await db.scalar(
-                select(ComboProduct).where(
+            price = await db.scalar(
+                select(ComboProduct.price).where(
                     ComboProduct.id == combo_product_id,
                     ComboProduct.restaurant_id == restaurant_id,
                     ComboProduct.available == True,
                 )
             )
-            if not combo:
+            if price is None:
                 raise CartValidationError("Combo product not found", field="combo_product_id")
-            unit_price = int(combo.price or 0)
+            unit_price = int(price)
         else:
             raise CartValidationError("Invalid item_type", field="item_type")
 
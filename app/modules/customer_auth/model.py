@@ -34,7 +34,7 @@ class CustomerEmailOTP(Base):
     consumed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
-    customer = relationship("Customer")
+    customer = relationship("Customer", viewonly=True)
 
     @staticmethod
     def default_expiry(now: Optional[datetime] = None) -> datetime:
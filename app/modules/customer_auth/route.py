@@ -111,7 +111,7 @@ async def _verify_customer_otp(payload: CustomerEmailOTPVerify, db: AsyncSession
 def _client_ip(request: Request) -> str:
     forwarded = request.headers.get("X-Forwarded-For")
     if forwarded:
-        return forwarded.split(",")[0].strip()
+        return forwarded.partition(",")[0].strip() or "unknown"
     return request.client.host if request.client else "unknown"
 
 
@@ -11,7 +11,7 @@ from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import create_access_token, create_refresh_token, decode_token, get_password_hash, verify_password
+from app.core.security import create_access_token, create_token_pair, decode_token, get_password_hash, verify_password_async
 from app.modules.customer.model import Customer
 from app.modules.customer.service import CustomerService
 from app.modules.customer.schema import CustomerUpdate
@@ -137,7 +137,7 @@ class CustomerAuthService:
         if record.attempts >= CustomerAuthService.OTP_MAX_ATTEMPTS:
             raise CustomerAuthError("Too many invalid attempts", code="OTP_LOCKED", status_code=429)
 
-        if not verify_password(otp, record.otp_hash):
+        if not await verify_password_async(otp, record.otp_hash):
             record.attempts += 1
             await db.commit()
             raise CustomerAuthError("Invalid OTP", code="OTP_INVALID", status_code=400)
@@ -190,8 +190,7 @@ class CustomerAuthService:
         token_data = {"sub": customer.id, "role": "customer"}
         if customer.restaurant_id:
             token_data["restaurant_id"] = customer.restaurant_id
-        access_token = create_access_token(data=token_data)
-        refresh_token = create_refresh_token(data=token_data)
+        access_token, refresh_token = create_token_pair(token_data)
         return {
             "access_token": access_token,
             "refresh_token": refresh_token,
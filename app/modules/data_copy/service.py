@@ -5,7 +5,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.data_copy.model import CopyLog, CopyStatus, CopyType, DataCopy
@@ -23,7 +23,7 @@ from app.modules.product.model import (
     Modifier,
     ModifierOption,
     Product,
-    ProductModifier,
+    product_modifiers,
 )
 from app.modules.restaurant.model import Restaurant
 from app.services.storage_service import copy_file_url, copy_file_urls_in_value
@@ -516,25 +516,28 @@ class DataCopyService:
             return
 
         result = await db.execute(
-            select(ProductModifier).where(
-                ProductModifier.restaurant_id == operation.source_restaurant_id,
-                ProductModifier.product_id.in_(entity_mapping["products"].keys()),
+            select(product_modifiers.c.product_id, product_modifiers.c.modifier_id).where(
+                product_modifiers.c.restaurant_id == operation.source_restaurant_id,
+                product_modifiers.c.product_id.in_(entity_mapping["products"].keys()),
             )
         )
-        for source_link in result.scalars().all():
-            product_id = entity_mapping["products"].get(source_link.product_id)
-            modifier_id = entity_mapping["modifiers"].get(source_link.modifier_id)
+        now = datetime.utcnow()
+        links = []
+        for source_product_id, source_modifier_id in result.all():
+            product_id = entity_mapping["products"].get(source_product_id)
+            modifier_id = entity_mapping["modifiers"].get(source_modifier_id)
             if not product_id or not modifier_id:
                 continue
-            db.add(
-                ProductModifier(
-                    id=str(uuid.uuid4()),
-                    restaurant_id=operation.destination_restaurant_id,
-                    product_id=product_id,
-                    modifier_id=modifier_id,
-                    created_at=datetime.utcnow(),
-                )
+            links.append(
+                {
+                    "restaurant_id": operation.destination_restaurant_id,
+                    "product_id": product_id,
+                    "modifier_id": modifier_id,
+                    "created_at": now,
+                }
             )
+        if links:
+            await db.execute(insert(product_modifiers), links)
         await db.flush()
 
     @staticmethod
@@ -265,15 +265,15 @@ class DataImportService:
         existing_categories = category_result.scalars().all()
         category_map = {cat.name.lower(): cat.id for cat in existing_categories}
         
-        # Get existing products for restaurant
-        product_query = select(Product).where(
+        # Get existing product names/SKUs for restaurant (validation needs nothing else)
+        product_query = select(Product.name, Product.sku).where(
             and_(
                 Product.restaurant_id == restaurant_id,
                 Product.deleted_at.is_(None)
             )
         )
         product_result = await db.execute(product_query)
-        existing_products = product_result.scalars().all()
+        existing_products = product_result.all()
         existing_names = {prod.name.lower() for prod in existing_products}
         existing_skus = {prod.sku.lower() for prod in existing_products if prod.sku}
         
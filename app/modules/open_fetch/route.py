@@ -11,14 +11,21 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.response import error_response, success_response
+from app.core.response import (
+    error_response,
+    orjson_success_response,
+    raw_success_response,
+    success_response,
+)
 from app.modules.homebanner.schema import HomeBannerResponse
 from app.modules.homebanner.service import HomeBannerService
+from app.modules.product.cache import get_cached_menu, set_cached_menu
 from app.modules.product.schema import (
-    CategoryResponse,
-    ComboProductResponse,
-    ModifierResponse,
-    ProductResponse,
+    CATEGORY_LIST,
+    COMBO_PRODUCT_LIST,
+    MODIFIER_LIST,
+    PRODUCT_LIST,
+    dump_list,
 )
 from app.modules.product.service import (
     CategoryService,
@@ -47,14 +54,20 @@ async def fetch_categories(
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
-    """Fetch categories with pagination."""
+    """Fetch categories with pagination (cached per restaurant)."""
     try:
-        categories = await CategoryService.get_categories_by_restaurant(
-            db, restaurant_id, active_only, skip, limit
-        )
-        return success_response(
+        variant = f"{int(active_only)}:{skip}:{limit}"
+        version, data = await get_cached_menu(restaurant_id, "categories", variant)
+        if data is None:
+            categories = await CategoryService.get_categories_by_restaurant(
+                db, restaurant_id, active_only, skip, limit
+            )
+            data = await set_cached_menu(
+                restaurant_id, version, "categories", variant, dump_list(CATEGORY_LIST, categories)
+            )
+        return raw_success_response(
             message="Categories retrieved successfully",
-            data=[CategoryResponse.model_validate(item).model_dump() for item in categories],
+            data_json=data,
         )
     except Exception as e:
         return error_response(
@@ -75,14 +88,30 @@ async def fetch_products(
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
-    """Fetch products with pagination."""
+    """Fetch products with pagination (cached per restaurant unless searching)."""
     try:
-        products = await ProductService.get_products_by_restaurant(
-            db, restaurant_id, category_id, available_only, featured_only, search, skip, limit
+        # Free-text searches are too varied to be worth caching
+        variant = None if search else (
+            f"{category_id or ''}:{int(available_only)}:{int(featured_only)}:{skip}:{limit}"
         )
-        return success_response(
+        version, data = (
+            await get_cached_menu(restaurant_id, "products", variant) if variant else (None, None)
+        )
+        if data is None:
+            products = await ProductService.get_products_by_restaurant(
+                db, restaurant_id, category_id, available_only, featured_only, search, skip, limit
+            )
+            if not variant:
+                return orjson_success_response(
+                    message="Products retrieved successfully",
+                    data=dump_list(PRODUCT_LIST, products),
+                )
+            data = await set_cached_menu(
+                restaurant_id, version, "products", variant, dump_list(PRODUCT_LIST, products)
+            )
+        return raw_success_response(
             message="Products retrieved successfully",
-            data=[ProductResponse.model_validate(item).model_dump() for item in products],
+            data_json=data,
         )
     except Exception as e:
         return error_response(
@@ -100,14 +129,20 @@ async def fetch_combo_products(
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
-    """Fetch combo products with pagination."""
+    """Fetch combo products with pagination (cached per restaurant)."""
     try:
-        combos = await ComboProductService.get_combos_by_restaurant(
-            db, restaurant_id, available_only, skip, limit
-        )
-        return success_response(
+        variant = f"{int(available_only)}:{skip}:{limit}"
+        version, data = await get_cached_menu(restaurant_id, "combos", variant)
+        if data is None:
+            combos = await ComboProductService.get_combos_by_restaurant(
+                db, restaurant_id, available_only, skip, limit
+            )
+            data = await set_cached_menu(
+                restaurant_id, version, "combos", variant, dump_list(COMBO_PRODUCT_LIST, combos)
+            )
+        return raw_success_response(
             message="Combo products retrieved successfully",
-            data=[ComboProductResponse.model_validate(item).model_dump() for item in combos],
+            data_json=data,
         )
     except Exception as e:
         return error_response(
@@ -124,12 +159,22 @@ async def fetch_modifiers(
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
-    """Fetch modifiers with pagination."""
+    """Fetch modifiers with pagination (cached per restaurant)."""
     try:
-        modifiers = await ModifierService.get_modifiers_by_restaurant(db, restaurant_id, skip, limit)
-        return success_response(
+        variant = f"{skip}:{limit}"
+        version, data = await get_cached_menu(restaurant_id, "modifiers", variant)
+        if data is None:
+            modifiers = await ModifierService.get_modifiers_by_restaurant(db, restaurant_id, skip, limit)
+            data = await set_cached_menu(
+                restaurant_id,
+                version,
+                "modifiers",
+                variant,
+                dump_list(MODIFIER_LIST, modifiers),
+            )
+        return raw_success_response(
             message="Modifiers retrieved successfully",
-            data=[ModifierResponse.model_validate(item).model_dump() for item in modifiers],
+            data_json=data,
         )
     except Exception as e:
         return error_response(
@@ -308,7 +308,7 @@ class Order(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Soft delete
     
     # Relationships
-    items: Mapped[List["OrderItem"]] = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    items: Mapped[List["OrderItem"]] = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan", passive_deletes=True)
     
     def __repr__(self) -> str:
         return f"<Order(id={self.id}, order_number={self.order_number}, type={self.order_type}, status={self.status}, total={self.total_amount})>"
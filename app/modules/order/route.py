@@ -134,7 +134,10 @@ async def create_order(
         await SubscriptionEnforcementService.assert_within_limit(
             db, order_data.restaurant_id, "orders"
         )
-        order = await OrderService.create_order(db, order_data, created_by=current_user.id)
+        # Order rows and the usage bump commit together
+        order = await OrderService.create_order(
+            db, order_data, created_by=current_user.id, commit=False
+        )
         await RestaurantService.increment_usage(db, order_data.restaurant_id, "orders")
         
         # Load items for response
@@ -69,4 +69,4 @@ class OrderPayment(Base):
         nullable=False,
     )
 
-    order: Mapped["Order"] = relationship("Order", foreign_keys=[order_id])
+    order: Mapped["Order"] = relationship("Order", foreign_keys=[order_id], viewonly=True)
@@ -0,0 +1,159 @@
+"""
+Per-restaurant menu response cache
+
+Public menu reads (categories, products, combos, modifiers) are cached in
+Redis as the JSON-encoded ``data`` payload, which routes splice into the
+response envelope without decoding it. Keys carry a per-restaurant version
+number; any committed change to a menu row bumps the version, so stale
+entries are simply never read again and expire on their TTL. A reader stores
+its result under the version it saw on the miss, before querying, so a reader
+that raced a write only ever fills the retired version.
+
+Menu writes commit through ``commit_menu``, which awaits the version bump
+before the write's response goes out. Commits made elsewhere are picked up by
+the session hooks below and invalidated in the background.
+"""
+import asyncio
+import logging
+from typing import Any, Optional, Set, Tuple
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache_client
+from app.core.config import settings
+from app.modules.product.model import (
+    Category, Product, Modifier, ModifierOption, ComboProduct, ComboItem
+)
+from app.modules.restaurant.model import Restaurant
+
+
+logger = logging.getLogger(__name__)
+
+# Rows whose changes alter a cached menu payload
+MENU_MODELS = (Category, Product, Modifier, ModifierOption, ComboProduct, ComboItem)
+
+_PENDING_KEY = "menu_cache_restaurants"
+# Set while commit_menu is committing: it invalidates itself, after the commit
+_COMMITTED_KEY = "menu_cache_committed"
+
+# Strong references to in-flight invalidations so they are not garbage collected
+_invalidations: Set[asyncio.Task] = set()
+
+
+def _version_key(restaurant_id: str) -> str:
+    return f"menu:{restaurant_id}:version"
+
+
+async def get_cached_menu(
+    restaurant_id: str, kind: str, variant: str
+) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Return ``(version, payload)`` for this menu view.
+
+    The payload is None on a miss; pass the version on to set_cached_menu so
+    the result is stored under the version seen before the rows were read.
+    """
+    if not settings.MENU_CACHE_ENABLED:
+        return None, None
+    try:
+        client = get_cache_client()
+        version = (await client.get(_version_key(restaurant_id))) or b"0"
+        raw = await client.get(f"menu:{restaurant_id}:{version.decode()}:{kind}:{variant}")
+    except Exception as e:
+        logger.warning("Menu cache read failed: %s", e)
+        return None, None
+    return version, raw
+
+
+async def set_cached_menu(
+    restaurant_id: str, version: Optional[bytes], kind: str, variant: str, data: Any
+) -> bytes:
+    """
+    Store a menu payload under the version get_cached_menu returned.
+
+    Returns the JSON encoding so the caller can send the same bytes it cached.
+    """
+    raw = orjson.dumps(data)
+    if version is None:
+        return raw
+    try:
+        await get_cache_client().set(
+            f"menu:{restaurant_id}:{version.decode()}:{kind}:{variant}",
+            raw,
+            ex=settings.MENU_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning("Menu cache write failed: %s", e)
+    return raw
+
+
+async def invalidate_menu(*restaurant_ids: str) -> None:
+    """Retire every cached menu view of the given restaurants."""
+    if not settings.MENU_CACHE_ENABLED or not restaurant_ids:
+        return
+    try:
+        client = get_cache_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for restaurant_id in restaurant_ids:
+                # The version outlives the entries it guards
+                pipe.incr(_version_key(restaurant_id))
+                pipe.expire(_version_key(restaurant_id), settings.MENU_CACHE_TTL_SECONDS * 2)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Menu cache invalidation failed: %s", e)
+
+
+async def commit_menu(db: AsyncSession) -> None:
+    """Commit, then retire the cached menus of every restaurant it touched."""
+    info = db.sync_session.info
+    info[_COMMITTED_KEY] = set()
+    try:
+        await db.commit()
+    finally:
+        restaurant_ids = info.pop(_COMMITTED_KEY)
+    await invalidate_menu(*restaurant_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_menu_changes(session: Session, flush_context) -> None:
+    """Remember which restaurants' menus this transaction touched."""
+    restaurant_ids = None
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, MENU_MODELS):
+            restaurant_id = obj.restaurant_id
+        elif isinstance(obj, Restaurant):
+            # Category payloads embed the restaurant name
+            restaurant_id = obj.id
+        else:
+            continue
+        if restaurant_ids is None:
+            restaurant_ids = session.info.setdefault(_PENDING_KEY, set())
+        restaurant_ids.add(restaurant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    restaurant_ids = session.info.pop(_PENDING_KEY, None)
+    if not restaurant_ids:
+        return
+    committed = session.info.get(_COMMITTED_KEY)
+    if committed is not None:
+        # commit_menu awaits the invalidation itself
+        committed.update(restaurant_ids)
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Synchronous session outside the event loop; entries age out on TTL
+        return
+    task = loop.create_task(invalidate_menu(*restaurant_ids))
+    _invalidations.add(task)
+    task.add_done_callback(_invalidations.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_menu_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
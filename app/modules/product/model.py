@@ -1,7 +1,7 @@
 """
 Product catalog and inventory models
 """
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Text, Enum as SQLEnum, JSON
+from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Text, Enum as SQLEnum, JSON, Index, UniqueConstraint, Table, Column, SmallInteger, CheckConstraint, PrimaryKeyConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import Optional, List
@@ -20,6 +20,15 @@ class ModifierType(str, enum.Enum):
 class Category(Base):
     """Product category model"""
     __tablename__ = "categories"
+    __table_args__ = (
+        # Menu listing: restaurant's active categories in display order
+        Index("ix_categories_restaurant_active_sort", "restaurant_id", "active", "sort_order"),
+        # Full listing (active_only=False) reads rows already in ORDER BY order
+        Index("ix_categories_restaurant_sort_name", "restaurant_id", "sort_order", "name"),
+        # Slug lookups are always scoped to a restaurant. Not unique: soft-deleted
+        # rows keep their slug and uniqueness is enforced among live rows only
+        Index("ix_categories_restaurant_slug", "restaurant_id", "slug"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
@@ -30,8 +39,8 @@ class Category(Base):
     )
     
     # Basic Information
-    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
-    slug: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    slug: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Parent-Child Hierarchy (Subcategories)
@@ -44,8 +53,8 @@ class Category(Base):
     level: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # 0 = root, 1 = subcategory, etc.
     
     # Display & Ordering
-    active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
-    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    sort_order: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False, index=True)
     is_featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Media
@@ -132,7 +141,8 @@ class Category(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Soft delete
     
     # Relationships
-    restaurant: Mapped["Restaurant"] = relationship("app.modules.restaurant.model.Restaurant")
+    restaurant: Mapped["Restaurant"] = relationship("app.modules.restaurant.model.Restaurant", viewonly=True)
+    products: Mapped[List["Product"]] = relationship("Product", back_populates="category", viewonly=True)
     
     def __repr__(self):
         return f"<Category(id={self.id}, name='{self.name}', restaurant_id={self.restaurant_id})>"
@@ -141,6 +151,18 @@ class Category(Base):
 class Product(Base):
     """Product model"""
     __tablename__ = "products"
+    __table_args__ = (
+        # Menu listing filters; category_id keeps its own index for the FK
+        Index("ix_products_restaurant_category_available", "restaurant_id", "category_id", "available"),
+        Index("ix_products_restaurant_featured", "restaurant_id", "featured"),
+        # Listings are ordered by name within a restaurant
+        Index("ix_products_restaurant_name", "restaurant_id", "name"),
+        # Restaurant-scoped slug lookups (non-unique, see Category)
+        Index("ix_products_restaurant_slug", "restaurant_id", "slug"),
+        CheckConstraint("price >= 0", name="ck_products_price_non_negative"),
+        CheckConstraint("stock >= 0", name="ck_products_stock_non_negative"),
+        CheckConstraint("min_stock >= 0", name="ck_products_min_stock_non_negative"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
@@ -151,8 +173,8 @@ class Product(Base):
     )
     
     # Basic Information
-    name: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
-    slug: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+    slug: Mapped[str] = mapped_column(String(200), nullable=False)
     sku: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True, unique=True)
     barcode: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -181,7 +203,7 @@ class Product(Base):
     
     # Inventory Management
     stock: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    min_stock: Mapped[int] = mapped_column(Integer, default=5, nullable=False)
+    min_stock: Mapped[int] = mapped_column(SmallInteger, default=5, nullable=False)
     max_stock: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     reorder_point: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     reorder_quantity: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -190,9 +212,9 @@ class Product(Base):
     stock_unit: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # piece, kg, liter, etc.
     
     # Availability & Status
-    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
+    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_published: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_new: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_bestseller: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_seasonal: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -231,7 +253,7 @@ class Product(Base):
     kitchen_station: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     preparation_area: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     printer_tag: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    preparation_time: Mapped[int] = mapped_column(Integer, default=15, nullable=False)
+    preparation_time: Mapped[int] = mapped_column(SmallInteger, default=15, nullable=False)
     cooking_instructions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Dietary & Allergen Information
@@ -290,7 +312,7 @@ class Product(Base):
     review_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
     # Sorting & Display
-    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    sort_order: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False, index=True)
     display_priority: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
     # Loyalty & Rewards
@@ -326,6 +348,11 @@ class Product(Base):
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Soft delete
     
+    # Read-only relationships; load them with selectinload() where a listing needs them
+    category: Mapped["Category"] = relationship("Category", back_populates="products", viewonly=True)
+    modifiers: Mapped[List["Modifier"]] = relationship("Modifier", secondary="product_modifiers", viewonly=True)
+    translations: Mapped[List["ProductTranslation"]] = relationship("ProductTranslation", viewonly=True)
+    
     def __repr__(self):
         return f"<Product(id={self.id}, name='{self.name}', price={self.price}, restaurant_id={self.restaurant_id})>"
 
@@ -362,7 +389,7 @@ class Modifier(Base):
         nullable=False
     )
     # Relationships
-    options: Mapped[List["ModifierOption"]] = relationship("ModifierOption", back_populates="modifier", cascade="all, delete-orphan", lazy="selectin")
+    options: Mapped[List["ModifierOption"]] = relationship("ModifierOption", back_populates="modifier", cascade="all, delete-orphan", lazy="selectin", passive_deletes=True)
     
     def __repr__(self):
         return f"<Modifier(id={self.id}, name='{self.name}', type='{self.type}', restaurant_id={self.restaurant_id})>"
@@ -387,8 +414,8 @@ class ModifierOption(Base):
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     price: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # In paise/cents
-    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
-    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    sort_order: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -403,36 +430,32 @@ class ModifierOption(Base):
         return f"<ModifierOption(id={self.id}, name='{self.name}', price={self.price})>"
 
 
-class ProductModifier(Base):
-    """Product-Modifier relationship"""
-    __tablename__ = "product_modifiers"
-    
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    restaurant_id: Mapped[str] = mapped_column(
+# Product <-> modifier link table. It carries no attributes of its own, so it
+# is a plain Table rather than a mapped class; the (product_id, modifier_id)
+# primary key is the row identity and also serves product_id lookups.
+product_modifiers = Table(
+    "product_modifiers",
+    Base.metadata,
+    Column("product_id", String(36), ForeignKey("products.id", ondelete="CASCADE"), primary_key=True),
+    Column("modifier_id", String(36), ForeignKey("modifiers.id", ondelete="CASCADE"), primary_key=True),
+    Column(
+        "restaurant_id",
         String(36),
         ForeignKey("restaurants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True
-    )
-    product_id: Mapped[str] = mapped_column(
-        String(36),
-        ForeignKey("products.id", ondelete="CASCADE"),
-        nullable=False
-    )
-    modifier_id: Mapped[str] = mapped_column(
-        String(36),
-        ForeignKey("modifiers.id", ondelete="CASCADE"),
-        nullable=False
-    )
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
-    
-    def __repr__(self):
-        return f"<ProductModifier(product_id={self.product_id}, modifier_id={self.modifier_id})>"
+        index=True,
+    ),
+    Column("created_at", DateTime, default=datetime.utcnow, nullable=False),
+)
 
 
 class ComboProduct(Base):
     """Combo/Bundle product model"""
     __tablename__ = "combo_products"
+    __table_args__ = (
+        # Restaurant-scoped slug lookups
+        Index("ix_combo_products_restaurant_slug", "restaurant_id", "slug"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
@@ -442,7 +465,7 @@ class ComboProduct(Base):
         index=True
     )
     name: Mapped[str] = mapped_column(String(200), nullable=False)
-    slug: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    slug: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     price: Mapped[int] = mapped_column(Integer, nullable=False)  # In paise/cents
     category_id: Mapped[str] = mapped_column(
@@ -452,12 +475,12 @@ class ComboProduct(Base):
         index=True
     )
     image: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
-    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False, index=True)
-    featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    featured: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     tags: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     valid_from: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     valid_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    max_quantity_per_order: Mapped[int] = mapped_column(Integer, default=10, nullable=False)
+    max_quantity_per_order: Mapped[int] = mapped_column(SmallInteger, default=10, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -466,6 +489,11 @@ class ComboProduct(Base):
         nullable=False
     )
     
+    # Relationships
+    items: Mapped[List["ComboItem"]] = relationship(
+        "ComboItem", back_populates="combo", order_by="ComboItem.sort_order", viewonly=True
+    )
+    
     def __repr__(self):
         return f"<ComboProduct(id={self.id}, name='{self.name}', price={self.price}, restaurant_id={self.restaurant_id})>"
 
@@ -496,9 +524,13 @@ class ComboItem(Base):
     required: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     choice_group: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     choices: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
-    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    sort_order: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     
+    # Relationships
+    combo: Mapped["ComboProduct"] = relationship("ComboProduct", back_populates="items", viewonly=True)
+    product: Mapped["Product"] = relationship("Product", viewonly=True)
+    
     def __repr__(self):
         return f"<ComboItem(combo_id={self.combo_id}, product_id={self.product_id}, qty={self.quantity})>"
 
@@ -506,19 +538,30 @@ class ComboItem(Base):
 class InventoryTransaction(Base):
     """Inventory transaction log"""
     __tablename__ = "inventory_transactions"
-    
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (
+        # InnoDB clusters rows on the primary key: leading with (restaurant_id,
+        # created_at) appends each restaurant's new rows at the tail of its range
+        # instead of at a random UUID position, and makes the newest-first history
+        # listing a clustered range scan. It also backs the restaurant_id FK.
+        PrimaryKeyConstraint("restaurant_id", "created_at", "id"),
+        # The ORM still identifies rows by the UUID alone (see __mapper_args__),
+        # so the database must keep it unique
+        UniqueConstraint("id", name="uq_inventory_transactions_id"),
+        # Per-product history; leads with product_id so it also backs that FK
+        Index("ix_inventory_transactions_product_created", "product_id", "created_at"),
+    )
+    __mapper_args__ = {"primary_key": ["id"]}
+    
+    id: Mapped[str] = mapped_column(String(36), nullable=False, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("restaurants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     product_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("products.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # purchase, sale, adjustment, waste
     quantity: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -534,7 +577,7 @@ class InventoryTransaction(Base):
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     
     def __repr__(self):
         return f"<InventoryTransaction(id={self.id}, product_id={self.product_id}, type='{self.type}', qty={self.quantity})>"
@@ -545,15 +588,18 @@ class InventoryTransaction(Base):
 class CategoryTranslation(Base):
     """Category translation model"""
     __tablename__ = "category_translations"
+    __table_args__ = (
+        # One translation per language; also the (parent, language) lookup index
+        UniqueConstraint("category_id", "language_code", name="uq_category_translations_category_language"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     category_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("categories.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    language_code: Mapped[str] = mapped_column(String(5), nullable=False, index=True)  # en, ta, hi, fr
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)  # en, ta, hi, fr
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -571,15 +617,18 @@ class CategoryTranslation(Base):
 class ProductTranslation(Base):
     """Product translation model"""
     __tablename__ = "product_translations"
+    __table_args__ = (
+        # One translation per language; also the (parent, language) lookup index
+        UniqueConstraint("product_id", "language_code", name="uq_product_translations_product_language"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     product_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("products.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    language_code: Mapped[str] = mapped_column(String(5), nullable=False, index=True)  # en, ta, hi, fr
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)  # en, ta, hi, fr
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -597,15 +646,18 @@ class ProductTranslation(Base):
 class ModifierTranslation(Base):
     """Modifier translation model"""
     __tablename__ = "modifier_translations"
+    __table_args__ = (
+        # One translation per language; also the (parent, language) lookup index
+        UniqueConstraint("modifier_id", "language_code", name="uq_modifier_translations_modifier_language"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     modifier_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("modifiers.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    language_code: Mapped[str] = mapped_column(String(5), nullable=False, index=True)  # en, ta, hi, fr
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)  # en, ta, hi, fr
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -622,15 +674,18 @@ class ModifierTranslation(Base):
 class ModifierOptionTranslation(Base):
     """Modifier option translation model"""
     __tablename__ = "modifier_option_translations"
+    __table_args__ = (
+        # One translation per language; also the (parent, language) lookup index
+        UniqueConstraint("modifier_option_id", "language_code", name="uq_modifier_option_translations_modifier_option_language"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     modifier_option_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("modifier_options.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    language_code: Mapped[str] = mapped_column(String(5), nullable=False, index=True)  # en, ta, hi, fr
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)  # en, ta, hi, fr
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -647,15 +702,18 @@ class ModifierOptionTranslation(Base):
 class ComboProductTranslation(Base):
     """Combo product translation model"""
     __tablename__ = "combo_product_translations"
+    __table_args__ = (
+        # One translation per language; also the (parent, language) lookup index
+        UniqueConstraint("combo_product_id", "language_code", name="uq_combo_product_translations_combo_product_language"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     combo_product_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("combo_products.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
-    language_code: Mapped[str] = mapped_column(String(5), nullable=False, index=True)  # en, ta, hi, fr
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)  # en, ta, hi, fr
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,17 +1,34 @@
 """
 Product catalog and inventory API routes
 """
-from fastapi import APIRouter, Depends, status, Request, UploadFile
+from fastapi import APIRouter, Depends, Query, status, Request, UploadFile
 from starlette.datastructures import UploadFile as StarletteUploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional, Tuple, Any
+from pydantic import BaseModel
+from typing import List, Optional, Tuple, Type, TypeVar, Any
+from datetime import datetime
 import json
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
-from app.core.response import success_response, error_response
+from app.core.response import (
+    success_response, orjson_success_response, raw_success_response, error_response
+)
+from app.core.timezone import convert_datetime_fields
 from app.modules.user.model import User
-from app.modules.product.schema import *
+from app.modules.product.schema import (
+    CategoryCreate, CategoryUpdate, CategoryResponse,
+    ProductCreate, ProductUpdate, ProductResponse,
+    ModifierCreate, ModifierUpdate, ModifierResponse,
+    ModifierOptionCreate, ModifierOptionUpdate, ModifierOptionResponse,
+    ComboProductCreate, ComboProductUpdate, ComboProductResponse,
+    ComboItemCreate, ComboItemsBulkCreate,
+    InventoryTransactionResponse, StockAdjustment, StockAdjustmentBulk,
+    CATEGORY_LIST, PRODUCT_LIST, MODIFIER_LIST, MODIFIER_OPTION_LIST,
+    MODIFIER_WITH_OPTIONS_LIST, COMBO_PRODUCT_LIST, COMBO_ITEM_LIST,
+    INVENTORY_TRANSACTION_LIST, dump_list,
+)
+from app.modules.product.cache import get_cached_menu, set_cached_menu
 from app.modules.product.service import (
     CategoryService, ProductService, ModifierService,
     InventoryService, ComboProductService, DuplicateError
@@ -26,6 +43,33 @@ from app.services.storage_service import (
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+PayloadT = TypeVar("PayloadT", bound=BaseModel)
+
+
+def _next_transaction_cursor(transactions: list, limit: int) -> Optional[dict]:
+    """Keyset cursor for the page after `transactions`, or None on the last page"""
+    if not transactions or len(transactions) < limit:
+        return None
+    last = transactions[-1]
+    return {"before": last.created_at, "before_id": last.id}
+
+
+def _transaction_cursor_error(skip: int, before: Optional[datetime], before_id: Optional[str]):
+    """422 response for a half-sent keyset cursor or a cursor combined with skip, else None"""
+    if (before is None) != (before_id is None):
+        details = "before and before_id must be sent together"
+    elif before is not None and skip:
+        details = "skip cannot be combined with the before/before_id cursor"
+    else:
+        return None
+    return error_response(
+        message="Invalid pagination cursor",
+        error_code="VALIDATION_ERROR",
+        error_details=details,
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+
+
 def _multipart_request_body(schema: dict) -> dict:
     return {
         "requestBody": {
@@ -149,12 +193,13 @@ MODIFIER_UPDATE_DOC = _multipart_request_body(
 )
 async def _parse_payload(
     request: Request,
+    schema: Type[PayloadT],
     file_field: Optional[str]
-) -> Tuple[dict, Optional[UploadFile]]:
+) -> Tuple[PayloadT, Optional[UploadFile]]:
     content_type = request.headers.get("content-type", "")
     if content_type.startswith("application/json"):
-        data = await request.json()
-        return data, None
+        # Parse and validate the raw body in one pass instead of via a dict
+        return schema.model_validate_json(await request.body()), None
 
     form = await request.form()
     data: dict[str, Any] = {}
@@ -187,7 +232,7 @@ async def _parse_payload(
                 # Keep as string if not valid JSON
                 pass
 
-    return data, upload
+    return schema.model_validate(data), upload
 
 
 async def _upload_and_replace(
@@ -222,17 +267,15 @@ async def create_category(
 ):
     """Create a new category"""
     try:
-        data, image_file = await _parse_payload(request, file_field="image")
+        category_data, image_file = await _parse_payload(request, CategoryCreate, file_field="image")
         if image_file:
-            image_url = await _upload_and_replace(None, image_file, folder="categories")
-            data["image"] = image_url
+            category_data.image = await _upload_and_replace(None, image_file, folder="categories")
 
-        category_data = CategoryCreate(**data)
         category = await CategoryService.create_category(db, category_data)
         # Use current_user.timezone for automatic datetime conversion
         return success_response(
             message="Category created successfully",
-            data=CategoryResponse.model_validate(category).model_dump(),
+            data=CategoryResponse.model_validate(category),
             timezone=getattr(current_user, 'timezone', None)
         )
     except DuplicateError as e:
@@ -250,12 +293,6 @@ async def create_category(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to create category",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.get("/categories/restaurant/{restaurant_id}")
@@ -268,26 +305,25 @@ async def get_categories(
     db: AsyncSession = Depends(get_db)
 ):
     """Get categories for a restaurant"""
-    try:
+    # Use current_user.timezone for automatic datetime conversion. The cache
+    # holds the already-converted payload, so the timezone is part of the key.
+    timezone = getattr(current_user, 'timezone', None)
+    variant = f"{int(active_only)}:{skip}:{limit}:{timezone or ''}"
+    version, categories_data = await get_cached_menu(restaurant_id, "categories-admin", variant)
+    if categories_data is None:
         categories = await CategoryService.get_categories_by_restaurant(
             db, restaurant_id, active_only, skip, limit
         )
-        categories_data = [
-            CategoryResponse.model_validate(c).model_dump()
-            for c in categories
-        ]
-        # Use current_user.timezone for automatic datetime conversion
-        return success_response(
-            message="Categories retrieved successfully",
-            data=categories_data,
-            timezone=getattr(current_user, 'timezone', None)
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve categories",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+        categories_data = dump_list(CATEGORY_LIST, categories)
+        if timezone:
+            categories_data = convert_datetime_fields(categories_data, timezone)
+        categories_data = await set_cached_menu(
+            restaurant_id, version, "categories-admin", variant, categories_data
         )
+    return raw_success_response(
+        message="Categories retrieved successfully",
+        data_json=categories_data,
+    )
 
 
 @router.get("/categories/{category_id}")
@@ -297,27 +333,20 @@ async def get_category(
     db: AsyncSession = Depends(get_db)
 ):
     """Get category by ID"""
-    try:
-        category = await CategoryService.get_category_by_id(db, category_id)
-        if not category:
-            return error_response(
-                message="Category not found",
-                error_code="NOT_FOUND",
-                error_details=f"Category with ID {category_id} not found"
-            )
-        
-        # Use current_user.timezone for automatic datetime conversion
-        return success_response(
-            message="Category retrieved successfully",
-            data=CategoryResponse.model_validate(category).model_dump(),
-            timezone=getattr(current_user, 'timezone', None)
-        )
-    except Exception as e:
+    category = await CategoryService.get_category_by_id(db, category_id)
+    if not category:
         return error_response(
-            message="Failed to retrieve category",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+            message="Category not found",
+            error_code="NOT_FOUND",
+            error_details=f"Category with ID {category_id} not found"
+        )
+    
+    # Use current_user.timezone for automatic datetime conversion
+    return success_response(
+        message="Category retrieved successfully",
+        data=CategoryResponse.model_validate(category),
+        timezone=getattr(current_user, 'timezone', None)
+    )
 
 @router.post("/categories/{category_id}", openapi_extra=CATEGORY_UPDATE_DOC)
 @router.patch("/categories/{category_id}", openapi_extra=CATEGORY_UPDATE_DOC)
@@ -338,16 +367,15 @@ async def update_category(
                 error_details=f"Category with ID {category_id} not found"
             )
 
-        data, image_file = await _parse_payload(request, file_field="image")
+        category_data, image_file = await _parse_payload(request, CategoryUpdate, file_field="image")
         image_url = await _upload_and_replace(
             existing.image,
             image_file,
             folder="categories"
         )
         if image_url:
-            data["image"] = image_url
+            category_data.image = image_url
 
-        category_data = CategoryUpdate(**data)
         category = await CategoryService.update_category(db, category_id, category_data)
         if not category:
             return error_response(
@@ -358,7 +386,7 @@ async def update_category(
         
         return success_response(
             message="Category updated successfully",
-            data=CategoryResponse.model_validate(category).model_dump()
+            data=CategoryResponse.model_validate(category)
         )
     except DuplicateError as e:
         return error_response(
@@ -375,12 +403,6 @@ async def update_category(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to update category",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.delete("/categories/{category_id}")
@@ -390,25 +412,18 @@ async def delete_category(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete category"""
-    try:
-        deleted = await CategoryService.delete_category(db, category_id)
-        if not deleted:
-            return error_response(
-                message="Category not found",
-                error_code="NOT_FOUND",
-                error_details=f"Category with ID {category_id} not found"
-            )
-        
-        return success_response(
-            message="Category deleted successfully",
-            data={"deleted_category_id": category_id}
-        )
-    except Exception as e:
+    deleted = await CategoryService.delete_category(db, category_id)
+    if not deleted:
         return error_response(
-            message="Failed to delete category",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Category not found",
+            error_code="NOT_FOUND",
+            error_details=f"Category with ID {category_id} not found"
         )
+    
+    return success_response(
+        message="Category deleted successfully",
+        data={"deleted_category_id": category_id}
+    )
 
 
 # Product Endpoints
@@ -421,12 +436,10 @@ async def create_product(
 ):
     """Create a new product"""
     try:
-        data, image_file = await _parse_payload(request, file_field="image")
+        product_data, image_file = await _parse_payload(request, ProductCreate, file_field="image")
         if image_file:
-            image_url = await _upload_and_replace(None, image_file, folder="products")
-            data["image"] = image_url
+            product_data.image = await _upload_and_replace(None, image_file, folder="products")
 
-        product_data = ProductCreate(**data)
         if product_data.restaurant_id:
             from app.modules.restaurant.enforcement import SubscriptionEnforcementService
             from app.modules.restaurant.service import RestaurantService
@@ -434,13 +447,14 @@ async def create_product(
             await SubscriptionEnforcementService.assert_within_limit(
                 db, product_data.restaurant_id, "products"
             )
+            # Usage bump and insert commit together
+            await RestaurantService.increment_usage(
+                db, product_data.restaurant_id, "products", commit=False
+            )
         product = await ProductService.create_product(db, product_data)
-        if product_data.restaurant_id:
-            from app.modules.restaurant.service import RestaurantService
-            await RestaurantService.increment_usage(db, product_data.restaurant_id, "products")
         return success_response(
             message="Product created successfully",
-            data=ProductResponse.model_validate(product).model_dump()
+            data=ProductResponse.model_validate(product)
         )
     except DuplicateError as e:
         return error_response(
@@ -457,14 +471,6 @@ async def create_product(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        return error_response(
-            message="Failed to create product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.get("/restaurant/{restaurant_id}")
@@ -479,43 +485,56 @@ async def get_products(
     db: AsyncSession = Depends(get_db)
 ):
     """Get products for a restaurant with pagination"""
-    try:
-        products, total_items = await ProductService.get_products_paginated(
-            db,
-            restaurant_id,
-            category_id=category_id,
-            available_only=available_only,
-            featured_only=featured_only,
-            search=search,
-            page=page,
-            page_size=page_size,
-            dedupe_by_name=True,
-        )
-
-        products_data = [ProductResponse.model_validate(p).model_dump() for p in products]
-        total_pages = max(1, (total_items + page_size - 1) // page_size)
+    # Free-text searches are too varied to be worth caching
+    variant = None if search else (
+        f"{category_id or ''}:{int(available_only)}:{int(featured_only)}:{page}:{page_size}"
+    )
+    if variant:
+        version, cached = await get_cached_menu(restaurant_id, "products-page", variant)
+        if cached is not None:
+            return raw_success_response(
+                message="Products retrieved successfully",
+                data_json=cached,
+            )
 
-        return success_response(
+    products, total_items = await ProductService.get_products_paginated(
+        db,
+        restaurant_id,
+        category_id=category_id,
+        available_only=available_only,
+        featured_only=featured_only,
+        search=search,
+        page=page,
+        page_size=page_size,
+        dedupe_by_name=True,
+    )
+
+    products_data = dump_list(PRODUCT_LIST, products)
+    total_pages = max(1, (total_items + page_size - 1) // page_size)
+    data = {
+        "items": products_data,
+        "pagination": {
+            "page": page,
+            "page_size": page_size,
+            "total_items": total_items,
+            "total_pages": total_pages,
+            "has_previous": page > 1,
+            "has_next": page < total_pages,
+        },
+    }
+    if variant:
+        return raw_success_response(
             message="Products retrieved successfully",
-            data={
-                "items": products_data,
-                "pagination": {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_items,
-                    "total_pages": total_pages,
-                    "has_previous": page > 1,
-                    "has_next": page < total_pages,
-                },
-            },
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve products",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            data_json=await set_cached_menu(
+                restaurant_id, version, "products-page", variant, data
+            ),
         )
 
+    return orjson_success_response(
+        message="Products retrieved successfully",
+        data=data,
+    )
+
 
 @router.get("/restaurant/{restaurant_id}/low-stock")
 async def get_low_stock_products(
@@ -524,22 +543,19 @@ async def get_low_stock_products(
     db: AsyncSession = Depends(get_db)
 ):
     """Get products with low stock"""
-    try:
+    # Stock is written with Core UPDATEs that skip the flush hooks; this entry
+    # is retired only by the explicit invalidate_menu in create_transaction
+    # and bulk_adjust_stock
+    version, products_data = await get_cached_menu(restaurant_id, "low-stock", "all")
+    if products_data is None:
         products = await ProductService.get_low_stock_products(db, restaurant_id)
-        products_data = [
-            ProductResponse.model_validate(p).model_dump()
-            for p in products
-        ]
-        return success_response(
-            message="Low stock products retrieved successfully",
-            data=products_data
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve low stock products",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+        products_data = await set_cached_menu(
+            restaurant_id, version, "low-stock", "all", dump_list(PRODUCT_LIST, products)
         )
+    return raw_success_response(
+        message="Low stock products retrieved successfully",
+        data_json=products_data
+    )
 
 
 @router.get("/{product_id}")
@@ -548,25 +564,18 @@ async def get_product(
     db: AsyncSession = Depends(get_db)
 ):
     """Get product by ID"""
-    try:
-        product = await ProductService.get_product_by_id(db, product_id)
-        if not product:
-            return error_response(
-                message="Product not found",
-                error_code="NOT_FOUND",
-                error_details=f"Product with ID {product_id} not found"
-            )
-        
-        return success_response(
-            message="Product retrieved successfully",
-            data=ProductResponse.model_validate(product).model_dump()
-        )
-    except Exception as e:
+    product = await ProductService.get_product_by_id(db, product_id)
+    if not product:
         return error_response(
-            message="Failed to retrieve product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Product not found",
+            error_code="NOT_FOUND",
+            error_details=f"Product with ID {product_id} not found"
         )
+    
+    return success_response(
+        message="Product retrieved successfully",
+        data=ProductResponse.model_validate(product)
+    )
 
 
 @router.put("/{product_id}", openapi_extra=PRODUCT_UPDATE_DOC)
@@ -586,16 +595,15 @@ async def update_product(
                 error_details=f"Product with ID {product_id} not found"
             )
 
-        data, image_file = await _parse_payload(request, file_field="image")
+        product_data, image_file = await _parse_payload(request, ProductUpdate, file_field="image")
         image_url = await _upload_and_replace(
             existing.image,
             image_file,
             folder="products"
         )
         if image_url:
-            data["image"] = image_url
+            product_data.image = image_url
 
-        product_data = ProductUpdate(**data)
         product = await ProductService.update_product(db, product_id, product_data)
         if not product:
             return error_response(
@@ -606,7 +614,7 @@ async def update_product(
         
         return success_response(
             message="Product updated successfully",
-            data=ProductResponse.model_validate(product).model_dump()
+            data=ProductResponse.model_validate(product)
         )
     except DuplicateError as e:
         return error_response(
@@ -623,12 +631,6 @@ async def update_product(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to update product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.delete("/{product_id}")
@@ -638,25 +640,18 @@ async def delete_product(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete product"""
-    try:
-        deleted = await ProductService.delete_product(db, product_id)
-        if not deleted:
-            return error_response(
-                message="Product not found",
-                error_code="NOT_FOUND",
-                error_details=f"Product with ID {product_id} not found"
-            )
-        
-        return success_response(
-            message="Product deleted successfully",
-            data={"deleted_product_id": product_id}
-        )
-    except Exception as e:
+    deleted = await ProductService.delete_product(db, product_id)
+    if not deleted:
         return error_response(
-            message="Failed to delete product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Product not found",
+            error_code="NOT_FOUND",
+            error_details=f"Product with ID {product_id} not found"
         )
+    
+    return success_response(
+        message="Product deleted successfully",
+        data={"deleted_product_id": product_id}
+    )
 
 
 # Inventory Endpoints
@@ -675,7 +670,7 @@ async def adjust_stock(
         )
         return success_response(
             message="Stock adjusted successfully",
-            data=InventoryTransactionResponse.model_validate(transaction).model_dump()
+            data=InventoryTransactionResponse.model_validate(transaction)
         )
     except ValueError as e:
         return error_response(
@@ -683,71 +678,92 @@ async def adjust_stock(
             error_code="INVALID_OPERATION",
             error_details=str(e)
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to adjust stock",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
-@router.get("/inventory/product/{product_id}/transactions")
-async def get_product_transactions(
-    product_id: str,
-    skip: int = 0,
-    limit: int = 100,
+@router.post("/inventory/adjust/bulk", status_code=status.HTTP_201_CREATED)
+async def bulk_adjust_stock(
+    restaurant_id: str,
+    payload: StockAdjustmentBulk,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get inventory transactions for a product"""
+    """Adjust stock for several products in one go (e.g. end-of-shift counts)"""
     try:
-        transactions = await InventoryService.get_product_transactions(
-            db, product_id, skip, limit
+        transactions = await InventoryService.bulk_adjust_stock(
+            db, restaurant_id, payload.adjustments, current_user.id
         )
-        transactions_data = [
-            InventoryTransactionResponse.model_validate(t).model_dump()
-            for t in transactions
-        ]
         return success_response(
-            message="Transactions retrieved successfully",
-            data=transactions_data
+            message="Stock adjusted successfully",
+            data=dump_list(INVENTORY_TRANSACTION_LIST, transactions),
+            status_code=status.HTTP_201_CREATED
         )
-    except Exception as e:
+    except ValueError as e:
         return error_response(
-            message="Failed to retrieve transactions",
-            error_code="INTERNAL_ERROR",
+            message="Stock adjustment failed",
+            error_code="INVALID_OPERATION",
             error_details=str(e)
         )
 
 
+@router.get("/inventory/product/{product_id}/transactions")
+async def get_product_transactions(
+    product_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get inventory transactions for a product
+    
+    - **skip**: Number of records to skip (pagination, not combinable with the cursor)
+    - **before** / **before_id**: Keyset cursor from the previous page's `meta.next_cursor`, sent together
+    """
+    cursor_error = _transaction_cursor_error(skip, before, before_id)
+    if cursor_error is not None:
+        return cursor_error
+    transactions = await InventoryService.get_product_transactions(
+        db, product_id, skip, limit, before=before, before_id=before_id
+    )
+    transactions_data = dump_list(INVENTORY_TRANSACTION_LIST, transactions)
+    return orjson_success_response(
+        message="Transactions retrieved successfully",
+        data=transactions_data,
+        meta={"next_cursor": _next_transaction_cursor(transactions, limit)}
+    )
+
+
 @router.get("/inventory/restaurant/{restaurant_id}/transactions")
 async def get_restaurant_transactions(
     restaurant_id: str,
     transaction_type: Optional[str] = None,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Get inventory transactions for a restaurant"""
-    try:
-        transactions = await InventoryService.get_restaurant_transactions(
-            db, restaurant_id, transaction_type, skip, limit
-        )
-        transactions_data = [
-            InventoryTransactionResponse.model_validate(t).model_dump()
-            for t in transactions
-        ]
-        return success_response(
-            message="Transactions retrieved successfully",
-            data=transactions_data
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve transactions",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+    """
+    Get inventory transactions for a restaurant
+    
+    - **skip**: Number of records to skip (pagination, not combinable with the cursor)
+    - **before** / **before_id**: Keyset cursor from the previous page's `meta.next_cursor`, sent together
+    """
+    cursor_error = _transaction_cursor_error(skip, before, before_id)
+    if cursor_error is not None:
+        return cursor_error
+    transactions = await InventoryService.get_restaurant_transactions(
+        db, restaurant_id, transaction_type, skip, limit, before=before, before_id=before_id
+    )
+    transactions_data = dump_list(INVENTORY_TRANSACTION_LIST, transactions)
+    return orjson_success_response(
+        message="Transactions retrieved successfully",
+        data=transactions_data,
+        meta={"next_cursor": _next_transaction_cursor(transactions, limit)}
+    )
 
 
 # Modifier Endpoints
@@ -761,25 +777,15 @@ async def get_modifiers(
     db: AsyncSession = Depends(get_db)
 ):
     """Get modifiers for a restaurant"""
-    try:
-        modifiers = await ModifierService.get_modifiers_by_restaurant(
-            db, restaurant_id, skip, limit
-        )
-        modifiers_data = [
-            ModifierResponse.model_validate(m).model_dump()
-            for m in modifiers
-        ]
-        return success_response(
-            message="Modifiers retrieved successfully",
-            data=modifiers_data,
-            timezone=getattr(current_user, "timezone", None)
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve modifiers",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+    modifiers = await ModifierService.get_modifiers_by_restaurant(
+        db, restaurant_id, skip, limit
+    )
+    modifiers_data = dump_list(MODIFIER_LIST, modifiers)
+    return success_response(
+        message="Modifiers retrieved successfully",
+        data=modifiers_data,
+        timezone=getattr(current_user, "timezone", None)
+    )
 
 @router.post("/modifiers", status_code=status.HTTP_201_CREATED, openapi_extra=MODIFIER_CREATE_DOC)
 async def create_modifier(
@@ -789,16 +795,14 @@ async def create_modifier(
 ):
     """Create a new modifier"""
     try:
-        data, icon_file = await _parse_payload(request, file_field="icon")
+        modifier_data, icon_file = await _parse_payload(request, ModifierCreate, file_field="icon")
         if icon_file:
-            icon_url = await _upload_and_replace(None, icon_file, folder="modifiers")
-            data["icon_url"] = icon_url
+            modifier_data.icon_url = await _upload_and_replace(None, icon_file, folder="modifiers")
 
-        modifier_data = ModifierCreate(**data)
         modifier = await ModifierService.create_modifier(db, modifier_data)
         return success_response(
             message="Modifier created successfully",
-            data=ModifierResponse.model_validate(modifier).model_dump()
+            data=ModifierResponse.model_validate(modifier)
         )
     except ValueError as e:
         return error_response(
@@ -807,12 +811,6 @@ async def create_modifier(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to create modifier",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.put("/modifiers/{modifier_id}", openapi_extra=MODIFIER_UPDATE_DOC)
@@ -832,16 +830,15 @@ async def update_modifier(
                 error_details=f"Modifier with ID {modifier_id} not found"
             )
 
-        data, icon_file = await _parse_payload(request, file_field="icon")
+        modifier_data, icon_file = await _parse_payload(request, ModifierUpdate, file_field="icon")
         icon_url = await _upload_and_replace(
             existing.icon_url,
             icon_file,
             folder="modifiers"
         )
         if icon_url:
-            data["icon_url"] = icon_url
+            modifier_data.icon_url = icon_url
 
-        modifier_data = ModifierUpdate(**data)
         modifier = await ModifierService.update_modifier(db, modifier_id, modifier_data)
         if not modifier:
             return error_response(
@@ -852,7 +849,7 @@ async def update_modifier(
 
         return success_response(
             message="Modifier updated successfully",
-            data=ModifierResponse.model_validate(modifier).model_dump()
+            data=ModifierResponse.model_validate(modifier)
         )
     except ValueError as e:
         return error_response(
@@ -861,12 +858,6 @@ async def update_modifier(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to update modifier",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.delete("/modifiers/{modifier_id}")
@@ -876,26 +867,19 @@ async def delete_modifier(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete modifier"""
-    try:
-        deleted = await ModifierService.delete_modifier(db, modifier_id)
-        if not deleted:
-            return error_response(
-                message="Modifier not found",
-                error_code="NOT_FOUND",
-                error_details=f"Modifier with ID {modifier_id} not found"
-            )
-
-        return success_response(
-            message="Modifier deleted successfully",
-            data={"deleted_modifier_id": modifier_id}
-        )
-    except Exception as e:
+    deleted = await ModifierService.delete_modifier(db, modifier_id)
+    if not deleted:
         return error_response(
-            message="Failed to delete modifier",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Modifier not found",
+            error_code="NOT_FOUND",
+            error_details=f"Modifier with ID {modifier_id} not found"
         )
 
+    return success_response(
+        message="Modifier deleted successfully",
+        data={"deleted_modifier_id": modifier_id}
+    )
+
 
 @router.post("/modifiers/options", status_code=status.HTTP_201_CREATED)
 async def create_modifier_option(
@@ -904,18 +888,11 @@ async def create_modifier_option(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new modifier option"""
-    try:
-        option = await ModifierService.create_modifier_option(db, option_data)
-        return success_response(
-            message="Modifier option created successfully",
-            data=ModifierOptionResponse.model_validate(option).model_dump()
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to create modifier option",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+    option = await ModifierService.create_modifier_option(db, option_data)
+    return success_response(
+        message="Modifier option created successfully",
+        data=ModifierOptionResponse.model_validate(option)
+    )
 
 
 @router.get("/modifiers/{modifier_id}/options")
@@ -925,19 +902,12 @@ async def get_modifier_options(
     db: AsyncSession = Depends(get_db)
 ):
     """Get options for a modifier"""
-    try:
-        options = await ModifierService.get_modifier_options(db, modifier_id)
-        return success_response(
-            message="Modifier options retrieved successfully",
-            data=[ModifierOptionResponse.model_validate(o).model_dump() for o in options],
-            timezone=getattr(current_user, "timezone", None)
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve modifier options",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+    options = await ModifierService.get_modifier_options(db, modifier_id)
+    return success_response(
+        message="Modifier options retrieved successfully",
+        data=dump_list(MODIFIER_OPTION_LIST, options),
+        timezone=getattr(current_user, "timezone", None)
+    )
 
 
 @router.put("/modifiers/options/{option_id}")
@@ -948,27 +918,20 @@ async def update_modifier_option(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a modifier option"""
-    try:
-        option = await ModifierService.update_modifier_option(db, option_id, option_data)
-        if not option:
-            return error_response(
-                message="Modifier option not found",
-                error_code="NOT_FOUND",
-                error_details=f"Modifier option with ID {option_id} not found"
-            )
-
-        return success_response(
-            message="Modifier option updated successfully",
-            data=ModifierOptionResponse.model_validate(option).model_dump(),
-            timezone=getattr(current_user, "timezone", None)
-        )
-    except Exception as e:
+    option = await ModifierService.update_modifier_option(db, option_id, option_data)
+    if not option:
         return error_response(
-            message="Failed to update modifier option",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Modifier option not found",
+            error_code="NOT_FOUND",
+            error_details=f"Modifier option with ID {option_id} not found"
         )
 
+    return success_response(
+        message="Modifier option updated successfully",
+        data=ModifierOptionResponse.model_validate(option),
+        timezone=getattr(current_user, "timezone", None)
+    )
+
 
 @router.delete("/modifiers/options/{option_id}")
 async def delete_modifier_option(
@@ -977,27 +940,20 @@ async def delete_modifier_option(
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a modifier option"""
-    try:
-        deleted = await ModifierService.delete_modifier_option(db, option_id)
-        if not deleted:
-            return error_response(
-                message="Modifier option not found",
-                error_code="NOT_FOUND",
-                error_details=f"Modifier option with ID {option_id} not found"
-            )
-
-        return success_response(
-            message="Modifier option deleted successfully",
-            data={"deleted_option_id": option_id},
-            timezone=getattr(current_user, "timezone", None)
-        )
-    except Exception as e:
+    deleted = await ModifierService.delete_modifier_option(db, option_id)
+    if not deleted:
         return error_response(
-            message="Failed to delete modifier option",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+            message="Modifier option not found",
+            error_code="NOT_FOUND",
+            error_details=f"Modifier option with ID {option_id} not found"
         )
 
+    return success_response(
+        message="Modifier option deleted successfully",
+        data={"deleted_option_id": option_id},
+        timezone=getattr(current_user, "timezone", None)
+    )
+
 
 @router.get("/modifiers/restaurant/{restaurant_id}/hierarchical")
 async def get_hierarchical_modifiers(
@@ -1006,21 +962,14 @@ async def get_hierarchical_modifiers(
     db: AsyncSession = Depends(get_db)
 ):
     """Get modifiers with nested options for a restaurant"""
-    try:
-        modifiers = await ModifierService.get_modifiers_with_options_by_restaurant(
-            db, restaurant_id
-        )
-        return success_response(
-            message="Hierarchical modifiers retrieved successfully",
-            data=[ModifierWithOptionsResponse.model_validate(m).model_dump() for m in modifiers],
-            timezone=getattr(current_user, "timezone", None)
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve hierarchical modifiers",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
+    modifiers = await ModifierService.get_modifiers_with_options_by_restaurant(
+        db, restaurant_id
+    )
+    return success_response(
+        message="Hierarchical modifiers retrieved successfully",
+        data=dump_list(MODIFIER_WITH_OPTIONS_LIST, modifiers),
+        timezone=getattr(current_user, "timezone", None)
+    )
 
 
 # Combo Product Endpoints
@@ -1033,16 +982,14 @@ async def create_combo(
 ):
     """Create a new combo product"""
     try:
-        data, image_file = await _parse_payload(request, file_field="image")
+        combo_data, image_file = await _parse_payload(request, ComboProductCreate, file_field="image")
         if image_file:
-            image_url = await _upload_and_replace(None, image_file, folder="combos")
-            data["image"] = image_url
+            combo_data.image = await _upload_and_replace(None, image_file, folder="combos")
 
-        combo_data = ComboProductCreate(**data)
         combo = await ComboProductService.create_combo(db, combo_data)
         return success_response(
             message="Combo product created successfully",
-            data=ComboProductResponse.model_validate(combo).model_dump()
+            data=ComboProductResponse.model_validate(combo)
         )
     except ValueError as e:
         return error_response(
@@ -1051,12 +998,6 @@ async def create_combo(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to create combo product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
-        )
 
 
 @router.put("/combos/{combo_id}", openapi_extra=COMBO_UPDATE_DOC)
@@ -1077,16 +1018,15 @@ async def update_combo(
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
-        data, image_file = await _parse_payload(request, file_field="image")
+        combo_data, image_file = await _parse_payload(request, ComboProductUpdate, file_field="image")
         image_url = await _upload_and_replace(
             existing.image,
             image_file,
             folder="combos",
         )
         if image_url:
-            data["image"] = image_url
+            combo_data.image = image_url
 
-        combo_data = ComboProductUpdate(**data)
         combo = await ComboProductService.update_combo(db, combo_id, combo_data)
         if not combo:
             return error_response(
@@ -1098,7 +1038,7 @@ async def update_combo(
 
         return success_response(
             message="Combo product updated successfully",
-            data=ComboProductResponse.model_validate(combo).model_dump(),
+            data=ComboProductResponse.model_validate(combo),
         )
     except ValueError as e:
         return error_response(
@@ -1107,12 +1047,6 @@ async def update_combo(
             error_details=str(e),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
-    except Exception as e:
-        return error_response(
-            message="Failed to update combo product",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e),
-        )
 
 
 @router.get("/combos/restaurant/{restaurant_id}")
@@ -1124,24 +1058,20 @@ async def get_combos(
     db: AsyncSession = Depends(get_db)
 ):
     """Get combo products for a restaurant"""
-    try:
+    # Same payload as the open combo listing, so the cache entry is shared
+    variant = f"{int(available_only)}:{skip}:{limit}"
+    version, combos_data = await get_cached_menu(restaurant_id, "combos", variant)
+    if combos_data is None:
         combos = await ComboProductService.get_combos_by_restaurant(
             db, restaurant_id, available_only, skip, limit
         )
-        combos_data = [
-            ComboProductResponse.model_validate(c).model_dump()
-            for c in combos
-        ]
-        return success_response(
-            message="Combo products retrieved successfully",
-            data=combos_data
-        )
-    except Exception as e:
-        return error_response(
-            message="Failed to retrieve combo products",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e)
+        combos_data = await set_cached_menu(
+            restaurant_id, version, "combos", variant, dump_list(COMBO_PRODUCT_LIST, combos)
         )
+    return raw_success_response(
+        message="Combo products retrieved successfully",
+        data_json=combos_data
+    )
 
 
 @router.post("/combos/{combo_id}/items", status_code=status.HTTP_201_CREATED)
@@ -1152,66 +1082,59 @@ async def add_combo_items(
     db: AsyncSession = Depends(get_db),
 ):
     """Add items to an existing combo product"""
-    try:
-        combo = await ComboProductService.get_combo_by_id(db, combo_id)
-        if not combo:
-            return error_response(
-                message="Combo product not found",
-                error_code="NOT_FOUND",
-                error_details=f"Combo product with ID {combo_id} not found",
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Validate all referenced products exist and belong to the same restaurant
-        referenced_product_ids: set[str] = set()
-        for item in payload.items:
-            referenced_product_ids.add(item.product_id)
-            if item.choices:
-                referenced_product_ids.update(item.choices)
+    combo = await ComboProductService.get_combo_by_id(db, combo_id)
+    if not combo:
+        return error_response(
+            message="Combo product not found",
+            error_code="NOT_FOUND",
+            error_details=f"Combo product with ID {combo_id} not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
 
-        products = await ProductService.get_products_by_ids(db, list(referenced_product_ids))
-        products_by_id = {p.id: p for p in products}
+    # Validate all referenced products exist and belong to the same restaurant
+    referenced_product_ids: set[str] = set()
+    for item in payload.items:
+        referenced_product_ids.add(item.product_id)
+        if item.choices:
+            referenced_product_ids.update(item.choices)
 
-        missing_ids = sorted(pid for pid in referenced_product_ids if pid not in products_by_id)
-        if missing_ids:
-            return error_response(
-                message="One or more products not found",
-                error_code="NOT_FOUND",
-                error_details={"missing_product_ids": missing_ids},
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
+    products = await ProductService.get_products_by_ids(db, list(referenced_product_ids))
+    products_by_id = {p.id: p for p in products}
 
-        invalid_restaurant_ids = sorted(
-            pid for pid, p in products_by_id.items() if p.restaurant_id != combo.restaurant_id
+    missing_ids = sorted(pid for pid in referenced_product_ids if pid not in products_by_id)
+    if missing_ids:
+        return error_response(
+            message="One or more products not found",
+            error_code="NOT_FOUND",
+            error_details={"missing_product_ids": missing_ids},
+            status_code=status.HTTP_404_NOT_FOUND,
         )
-        if invalid_restaurant_ids:
-            return error_response(
-                message="One or more products belong to a different restaurant",
-                error_code="VALIDATION_ERROR",
-                error_details={"invalid_product_ids": invalid_restaurant_ids},
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
 
-        items_data = [
-            ComboItemCreate(
-                restaurant_id=combo.restaurant_id,
-                combo_id=combo_id,
-                **item.model_dump(),
-            )
-            for item in payload.items
-        ]
-        items = await ComboProductService.add_combo_items(db, items_data)
-
-        return success_response(
-            message="Combo items added successfully",
-            data=[ComboItemResponse.model_validate(i).model_dump() for i in items],
-        )
-    except Exception as e:
+    invalid_restaurant_ids = sorted(
+        pid for pid, p in products_by_id.items() if p.restaurant_id != combo.restaurant_id
+    )
+    if invalid_restaurant_ids:
         return error_response(
-            message="Failed to add combo items",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e),
+            message="One or more products belong to a different restaurant",
+            error_code="VALIDATION_ERROR",
+            error_details={"invalid_product_ids": invalid_restaurant_ids},
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+
+    items_data = [
+        ComboItemCreate(
+            restaurant_id=combo.restaurant_id,
+            combo_id=combo_id,
+            **item.model_dump(),
         )
+        for item in payload.items
+    ]
+    items = await ComboProductService.add_combo_items(db, items_data)
+
+    return success_response(
+        message="Combo items added successfully",
+        data=dump_list(COMBO_ITEM_LIST, items),
+    )
 
 
 @router.get("/combos/{combo_id}/items")
@@ -1220,24 +1143,17 @@ async def get_combo_items(
     db: AsyncSession = Depends(get_db),
 ):
     """Get items for a combo product"""
-    try:
-        combo = await ComboProductService.get_combo_by_id(db, combo_id)
-        if not combo:
-            return error_response(
-                message="Combo product not found",
-                error_code="NOT_FOUND",
-                error_details=f"Combo product with ID {combo_id} not found",
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
-
-        items = await ComboProductService.get_combo_items(db, combo_id)
-        return success_response(
-            message="Combo items retrieved successfully",
-            data=[ComboItemResponse.model_validate(i).model_dump() for i in items],
-        )
-    except Exception as e:
+    combo = await ComboProductService.get_combo_by_id(db, combo_id)
+    if not combo:
         return error_response(
-            message="Failed to retrieve combo items",
-            error_code="INTERNAL_ERROR",
-            error_details=str(e),
+            message="Combo product not found",
+            error_code="NOT_FOUND",
+            error_details=f"Combo product with ID {combo_id} not found",
+            status_code=status.HTTP_404_NOT_FOUND,
         )
+
+    items = await ComboProductService.get_combo_items(db, combo_id)
+    return success_response(
+        message="Combo items retrieved successfully",
+        data=dump_list(COMBO_ITEM_LIST, items),
+    )
@@ -1,12 +1,17 @@
 """
 Product catalog and inventory schemas
 """
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
 from datetime import datetime
 from typing import Optional, List
 from app.modules.product.model import ModifierType
 
 
+# Bounds of the SMALLINT columns (sort orders, prep times, stock thresholds)
+SMALLINT_MIN = -32768
+SMALLINT_MAX = 32767
+
+
 # Category Schemas
 
 class CategoryBase(BaseModel):
@@ -22,7 +27,7 @@ class CategoryBase(BaseModel):
     
     # Display & Ordering
     active: bool = True
-    sort_order: int = 0
+    sort_order: int = Field(0, ge=SMALLINT_MIN, le=SMALLINT_MAX)
     is_featured: bool = False
     
     # Media
@@ -117,7 +122,7 @@ class CategoryUpdate(BaseModel):
     
     # Display & Ordering
     active: Optional[bool] = None
-    sort_order: Optional[int] = None
+    sort_order: Optional[int] = Field(None, ge=SMALLINT_MIN, le=SMALLINT_MAX)
     is_featured: Optional[bool] = None
     
     # Media
@@ -236,7 +241,7 @@ class ProductBase(BaseModel):
     
     # Inventory Management
     stock: int = Field(0, ge=0)
-    min_stock: int = Field(5, ge=0)
+    min_stock: int = Field(5, ge=0, le=SMALLINT_MAX)
     max_stock: Optional[int] = Field(None, ge=0)
     reorder_point: Optional[int] = Field(None, ge=0)
     reorder_quantity: Optional[int] = Field(None, ge=0)
@@ -286,7 +291,7 @@ class ProductBase(BaseModel):
     kitchen_station: Optional[str] = Field(None, max_length=50)
     preparation_area: Optional[str] = Field(None, max_length=50)
     printer_tag: Optional[str] = None
-    preparation_time: int = Field(15, ge=0)
+    preparation_time: int = Field(15, ge=0, le=SMALLINT_MAX)
     cooking_instructions: Optional[str] = None
     
     # Dietary & Allergen Information
@@ -345,7 +350,7 @@ class ProductBase(BaseModel):
     review_count: int = 0
     
     # Sorting & Display
-    sort_order: int = 0
+    sort_order: int = Field(0, ge=SMALLINT_MIN, le=SMALLINT_MAX)
     display_priority: int = 0
     
     # Loyalty & Rewards
@@ -404,7 +409,7 @@ class ProductUpdate(BaseModel):
     
     # Inventory Management
     stock: Optional[int] = Field(None, ge=0)
-    min_stock: Optional[int] = Field(None, ge=0)
+    min_stock: Optional[int] = Field(None, ge=0, le=SMALLINT_MAX)
     max_stock: Optional[int] = Field(None, ge=0)
     reorder_point: Optional[int] = Field(None, ge=0)
     reorder_quantity: Optional[int] = Field(None, ge=0)
@@ -454,7 +459,7 @@ class ProductUpdate(BaseModel):
     kitchen_station: Optional[str] = Field(None, max_length=50)
     preparation_area: Optional[str] = Field(None, max_length=50)
     printer_tag: Optional[str] = None
-    preparation_time: Optional[int] = Field(None, ge=0)
+    preparation_time: Optional[int] = Field(None, ge=0, le=SMALLINT_MAX)
     cooking_instructions: Optional[str] = None
     
     # Dietary & Allergen Information
@@ -513,7 +518,7 @@ class ProductUpdate(BaseModel):
     review_count: Optional[int] = Field(None, ge=0)
     
     # Sorting & Display
-    sort_order: Optional[int] = None
+    sort_order: Optional[int] = Field(None, ge=SMALLINT_MIN, le=SMALLINT_MAX)
     display_priority: Optional[int] = None
     
     # Loyalty & Rewards
@@ -539,7 +544,7 @@ class ProductUpdate(BaseModel):
     admin_notes: Optional[str] = None
     department: Optional[str] = None
     printer_tag: Optional[str] = None
-    preparation_time: Optional[int] = Field(None, ge=0)
+    preparation_time: Optional[int] = Field(None, ge=0, le=SMALLINT_MAX)
     nutritional_info: Optional[dict] = None
 
 
@@ -562,7 +567,7 @@ class ModifierOptionBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     price: int = Field(0, ge=0)
     available: bool = True
-    sort_order: int = 0
+    sort_order: int = Field(0, ge=SMALLINT_MIN, le=SMALLINT_MAX)
 
 
 class ModifierOptionCreate(ModifierOptionBase):
@@ -576,7 +581,7 @@ class ModifierOptionUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     price: Optional[int] = Field(None, ge=0)
     available: Optional[bool] = None
-    sort_order: Optional[int] = None
+    sort_order: Optional[int] = Field(None, ge=SMALLINT_MIN, le=SMALLINT_MAX)
 
 
 class ModifierOptionResponse(ModifierOptionBase):
@@ -641,7 +646,7 @@ class ComboItemBase(BaseModel):
     required: bool = True
     choice_group: Optional[str] = None
     choices: Optional[List[str]] = None
-    sort_order: int = 0
+    sort_order: int = Field(0, ge=SMALLINT_MIN, le=SMALLINT_MAX)
 
 
 class ComboItemCreate(ComboItemBase):
@@ -683,7 +688,7 @@ class ComboProductBase(BaseModel):
     tags: Optional[List[str]] = None
     valid_from: Optional[datetime] = None
     valid_until: Optional[datetime] = None
-    max_quantity_per_order: int = Field(10, ge=1)
+    max_quantity_per_order: int = Field(10, ge=1, le=SMALLINT_MAX)
 
 
 class ComboProductCreate(ComboProductBase):
@@ -704,7 +709,7 @@ class ComboProductUpdate(BaseModel):
     tags: Optional[List[str]] = None
     valid_from: Optional[datetime] = None
     valid_until: Optional[datetime] = None
-    max_quantity_per_order: Optional[int] = Field(None, ge=1)
+    max_quantity_per_order: Optional[int] = Field(None, ge=1, le=SMALLINT_MAX)
 
 
 class ComboProductResponse(ComboProductBase):
@@ -759,6 +764,21 @@ class StockAdjustment(BaseModel):
     notes: Optional[str] = None
 
 
+class StockAdjustmentBulk(BaseModel):
+    """Schema for applying several stock adjustments at once"""
+    adjustments: List[StockAdjustment] = Field(..., min_length=1, max_length=500)
+
+    @field_validator('adjustments')
+    @classmethod
+    def unique_products(cls, v: List[StockAdjustment]) -> List[StockAdjustment]:
+        # Rows of one batch share a created_at second, so the history could not
+        # order several adjustments to the same product
+        product_ids = [adjustment.product_id for adjustment in v]
+        if len(set(product_ids)) != len(product_ids):
+            raise ValueError("Each product may appear only once per bulk adjustment")
+        return v
+
+
 # Translation Schemas
 
 class TranslationBase(BaseModel):
@@ -802,3 +822,21 @@ class TranslationResponse(TranslationBase):
     updated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
+
+
+# List serializers for menu endpoints: a whole list is validated and dumped in
+# one pydantic-core call instead of building a response model per row
+
+CATEGORY_LIST = TypeAdapter(List[CategoryResponse])
+PRODUCT_LIST = TypeAdapter(List[ProductResponse])
+MODIFIER_LIST = TypeAdapter(List[ModifierResponse])
+MODIFIER_OPTION_LIST = TypeAdapter(List[ModifierOptionResponse])
+MODIFIER_WITH_OPTIONS_LIST = TypeAdapter(List[ModifierWithOptionsResponse])
+COMBO_PRODUCT_LIST = TypeAdapter(List[ComboProductResponse])
+COMBO_ITEM_LIST = TypeAdapter(List[ComboItemResponse])
+INVENTORY_TRANSACTION_LIST = TypeAdapter(List[InventoryTransactionResponse])
+
+
+def dump_list(adapter: TypeAdapter, items) -> list:
+    """Serialize ORM objects (or rows) to plain dicts through a list adapter"""
+    return adapter.dump_python(adapter.validate_python(items, from_attributes=True))
@@ -2,15 +2,17 @@
 Product catalog and inventory service layer
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, text
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, update, delete, and_, or_, case, func, text, bindparam, Row
+from sqlalchemy.orm import raiseload, selectinload
 from typing import Optional, List, Tuple, Dict
 from datetime import datetime
 
 from app.modules.product.model import (
-    Category, Product, Modifier, ModifierOption, ProductModifier,
+    Category, Product, Modifier, ModifierOption,
     ComboProduct, ComboItem, InventoryTransaction
 )
+from app.modules.product.cache import commit_menu, invalidate_menu
+from app.modules.restaurant.model import Restaurant
 from app.modules.product.schema import (
     CategoryCreate, CategoryUpdate,
     ProductCreate, ProductUpdate,
@@ -19,7 +21,36 @@ from app.modules.product.schema import (
     ComboProductCreate, ComboProductUpdate,
     ComboItemCreate,
     InventoryTransactionCreate,
-    StockAdjustment
+    StockAdjustment,
+    ProductResponse,
+    InventoryTransactionResponse
+)
+
+
+# Columns needed to render the list responses. Hot listings select these as
+# plain rows instead of hydrating ORM instances into the identity map.
+PRODUCT_LIST_COLUMNS = tuple(getattr(Product, name) for name in ProductResponse.model_fields)
+INVENTORY_TRANSACTION_LIST_COLUMNS = tuple(
+    getattr(InventoryTransaction, name) for name in InventoryTransactionResponse.model_fields
+)
+
+# Hot lookups are built once and executed with bound parameters, skipping
+# per-call statement construction and cache-key generation (as in auth.service)
+_PRODUCTS_BY_IDS = (
+    select(Product)
+    .options(raiseload("*"))
+    .where(Product.id.in_(bindparam("product_ids", expanding=True)))
+)
+_RESTAURANT_PRODUCTS_BY_IDS = _PRODUCTS_BY_IDS.where(Product.restaurant_id == bindparam("restaurant_id"))
+_MODIFIER_OPTIONS = (
+    select(ModifierOption)
+    .where(ModifierOption.modifier_id == bindparam("modifier_id"))
+    .order_by(ModifierOption.sort_order, ModifierOption.name)
+)
+_COMBO_ITEMS = (
+    select(ComboItem)
+    .where(ComboItem.combo_id == bindparam("combo_id"))
+    .order_by(ComboItem.sort_order)
 )
 
 
@@ -57,25 +88,31 @@ class CategoryService:
 
         category = Category(**category_data.model_dump())
         db.add(category)
-        await db.commit()
+        await commit_menu(db)
         
-        # Load with restaurant for name
-        result = await db.execute(
-            select(Category)
-            .options(joinedload(Category.restaurant))
-            .where(Category.id == category.id)
+        # The new row is already complete in memory; only the name is missing
+        category.restaurant_name = await db.scalar(
+            select(Restaurant.name).where(Restaurant.id == category.restaurant_id)
         )
-        category = result.scalar_one()
-        category.restaurant_name = category.restaurant.name
         
         return category
     
     @staticmethod
     async def get_category_by_id(db: AsyncSession, category_id: str) -> Optional[Category]:
-        """Get category by ID"""
-        result = await db.execute(select(Category).where(Category.id == category_id))
-        return result.scalar_one_or_none()
+        """Get category by ID (served from the session identity map when already loaded)"""
+        return await db.get(Category, category_id)
 
+    @staticmethod
+    def _with_restaurant_names(result) -> List[Category]:
+        """Attach restaurant_name from (Category, Restaurant.name) rows"""
+        # Only the name is selected; joining the whole restaurant row would pull
+        # every restaurants column per category
+        categories = []
+        for category, restaurant_name in result.all():
+            category.restaurant_name = restaurant_name
+            categories.append(category)
+        return categories
+    
     @staticmethod
     async def get_categories_by_ids(
         db: AsyncSession,
@@ -86,19 +123,16 @@ class CategoryService:
         if not category_ids:
             return []
         result = await db.execute(
-            select(Category)
-            .options(joinedload(Category.restaurant))
+            select(Category, Restaurant.name)
+            .options(raiseload("*"))
+            .outerjoin(Restaurant, Restaurant.id == Category.restaurant_id)
             .where(
                 Category.restaurant_id == restaurant_id,
                 Category.id.in_(category_ids),
                 Category.deleted_at.is_(None),
             )
         )
-        categories = list(result.scalars().unique().all())
-        for category in categories:
-            if getattr(category, "restaurant", None) is not None:
-                category.restaurant_name = category.restaurant.name
-        return categories
+        return CategoryService._with_restaurant_names(result)
     
     @staticmethod
     async def get_categories_by_restaurant(
@@ -110,8 +144,9 @@ class CategoryService:
     ) -> List[Category]:
         """Get categories by restaurant"""
         query = (
-            select(Category)
-            .options(joinedload(Category.restaurant))
+            select(Category, Restaurant.name)
+            .options(raiseload("*"))
+            .outerjoin(Restaurant, Restaurant.id == Category.restaurant_id)
             .where(
             Category.restaurant_id == restaurant_id,
             Category.deleted_at.is_(None)
@@ -123,11 +158,7 @@ class CategoryService:
         
         query = query.order_by(Category.sort_order, Category.name).offset(skip).limit(limit)
         result = await db.execute(query)
-        categories = list(result.scalars().all())
-        for category in categories:
-            if getattr(category, "restaurant", None) is not None:
-                category.restaurant_name = category.restaurant.name
-        return categories
+        return CategoryService._with_restaurant_names(result)
     
     @staticmethod
     async def update_category(
@@ -136,15 +167,18 @@ class CategoryService:
         category_data: CategoryUpdate
     ) -> Optional[Category]:
         """Update category"""
-        result = await db.execute(select(Category).where(Category.id == category_id))
-        category = result.scalar_one_or_none()
+        category = await db.get(Category, category_id)
         
         if not category:
             return None
+
+        update_data = category_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return category
             
         # Check uniqueness if name is updated
         if category_data.name:
-            stmt = select(Category).where(
+            stmt = select(Category.id).where(
                 Category.restaurant_id == category.restaurant_id,
                 Category.id != category_id,
                 func.lower(Category.name) == func.lower(category_data.name),
@@ -155,7 +189,7 @@ class CategoryService:
 
         # Check uniqueness if slug is updated
         if category_data.slug:
-            stmt = select(Category).where(
+            stmt = select(Category.id).where(
                 Category.restaurant_id == category.restaurant_id,
                 Category.id != category_id,
                 Category.slug == category_data.slug,
@@ -164,25 +198,30 @@ class CategoryService:
             if await db.scalar(stmt):
                  raise DuplicateError("Category with this slug already exists in this restaurant", field="slug")
         
-        update_data = category_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(category, field, value)
         
-        await db.commit()
-        await db.refresh(category)
+        await commit_menu(db)
         return category
     
     @staticmethod
     async def delete_category(db: AsyncSession, category_id: str) -> bool:
         """Soft delete category"""
-        result = await db.execute(select(Category).where(Category.id == category_id))
-        category = result.scalar_one_or_none()
-        
-        if not category:
+        # Only the restaurant id is needed (for cache invalidation), not the row
+        restaurant_id = await db.scalar(
+            select(Category.restaurant_id).where(Category.id == category_id)
+        )
+        if restaurant_id is None:
             return False
         
-        category.deleted_at = datetime.utcnow()
+        await db.execute(
+            update(Category)
+            .where(Category.id == category_id)
+            .values(deleted_at=datetime.utcnow())
+        )
         await db.commit()
+        # Core statements bypass the flush hooks that retire cached menus
+        await invalidate_menu(restaurant_id)
         return True
 
 
@@ -211,8 +250,8 @@ class ProductService:
         if search:
             conditions.append(
                 or_(
-                    Product.name.ilike(f"%{search}%"),
-                    Product.description.ilike(f"%{search}%"),
+                    Product.name.icontains(search, autoescape=True),
+                    Product.description.icontains(search, autoescape=True),
                 )
             )
         return conditions
@@ -302,6 +341,7 @@ class ProductService:
             skip = max(page - 1, 0) * page_size
             result = await db.execute(
                 select(Product)
+                .options(raiseload("*"))
                 .join(deduped_ids, Product.id == deduped_ids.c.product_id)
                 .order_by(Product.name)
                 .offset(skip)
@@ -316,7 +356,10 @@ class ProductService:
 
         skip = max(page - 1, 0) * page_size
         result = await db.execute(
-            base_query.order_by(Product.name).offset(skip).limit(page_size)
+            base_query.options(raiseload("*"))
+            .order_by(Product.name)
+            .offset(skip)
+            .limit(page_size)
         )
         return list(result.scalars().all()), total_items
 
@@ -351,7 +394,7 @@ class ProductService:
                  AND keeper_pm.modifier_id = pm.modifier_id
                 SET pm.product_id = :keeper_id
                 WHERE pm.product_id = :duplicate_id
-                  AND keeper_pm.id IS NULL
+                  AND keeper_pm.product_id IS NULL
                 """
             ),
             params,
@@ -442,6 +485,9 @@ class ProductService:
 
         if deleted:
             await db.commit()
+            # Raw DELETEs bypass the flush hooks that retire cached menus
+            if restaurant_id:
+                await invalidate_menu(restaurant_id)
 
         return {
             "duplicate_groups": duplicate_groups,
@@ -460,15 +506,13 @@ class ProductService:
         )
         product = Product(**product_data.model_dump())
         db.add(product)
-        await db.commit()
-        await db.refresh(product)
+        await commit_menu(db)
         return product
     
     @staticmethod
     async def get_product_by_id(db: AsyncSession, product_id: str) -> Optional[Product]:
         """Get product by ID"""
-        result = await db.execute(select(Product).where(Product.id == product_id))
-        return result.scalar_one_or_none()
+        return await db.get(Product, product_id)
 
     @staticmethod
     async def get_products_by_ids(
@@ -479,10 +523,13 @@ class ProductService:
         """Get products by IDs (order not guaranteed). Optionally scope to a restaurant."""
         if not product_ids:
             return []
-        q = select(Product).where(Product.id.in_(product_ids))
-        if restaurant_id is not None:
-            q = q.where(Product.restaurant_id == restaurant_id)
-        result = await db.execute(q)
+        if restaurant_id is None:
+            result = await db.execute(_PRODUCTS_BY_IDS, {"product_ids": list(product_ids)})
+        else:
+            result = await db.execute(
+                _RESTAURANT_PRODUCTS_BY_IDS,
+                {"product_ids": list(product_ids), "restaurant_id": restaurant_id},
+            )
         return list(result.scalars().all())
     
     @staticmethod
@@ -495,9 +542,9 @@ class ProductService:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Product]:
-        """Get products by restaurant with filters"""
-        query = select(Product).where(Product.restaurant_id == restaurant_id)
+    ) -> List[Row]:
+        """Get products by restaurant with filters (as plain rows)"""
+        query = select(*PRODUCT_LIST_COLUMNS).where(Product.restaurant_id == restaurant_id)
         
         if category_id:
             query = query.where(Product.category_id == category_id)
@@ -511,14 +558,14 @@ class ProductService:
         if search:
             query = query.where(
                 or_(
-                    Product.name.ilike(f"%{search}%"),
-                    Product.description.ilike(f"%{search}%")
+                    Product.name.icontains(search, autoescape=True),
+                    Product.description.icontains(search, autoescape=True)
                 )
             )
         
         query = query.order_by(Product.name).offset(skip).limit(limit)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
     
     @staticmethod
     async def get_low_stock_products(
@@ -526,7 +573,7 @@ class ProductService:
         restaurant_id: str
     ) -> List[Product]:
         """Get products with low stock"""
-        query = select(Product).where(
+        query = select(Product).options(raiseload("*")).where(
             and_(
                 Product.restaurant_id == restaurant_id,
                 Product.stock <= Product.min_stock
@@ -543,41 +590,47 @@ class ProductService:
         product_data: ProductUpdate
     ) -> Optional[Product]:
         """Update product"""
-        result = await db.execute(select(Product).where(Product.id == product_id))
-        product = result.scalar_one_or_none()
+        product = await db.get(Product, product_id)
         
         if not product:
             return None
 
         update_data = product_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return product
+
         next_name = update_data.get("name", product.name)
         next_slug = update_data.get("slug", product.slug)
-        await ProductService._assert_product_unique(
-            db,
-            product.restaurant_id,
-            next_name,
-            next_slug,
-            exclude_product_id=product_id,
-        )
+        # Only a changed name or slug can collide with another product
+        if next_name != product.name or next_slug != product.slug:
+            await ProductService._assert_product_unique(
+                db,
+                product.restaurant_id,
+                next_name,
+                next_slug,
+                exclude_product_id=product_id,
+            )
 
         for field, value in update_data.items():
             setattr(product, field, value)
         
-        await db.commit()
-        await db.refresh(product)
+        await commit_menu(db)
         return product
     
     @staticmethod
     async def delete_product(db: AsyncSession, product_id: str) -> bool:
         """Delete product"""
-        result = await db.execute(select(Product).where(Product.id == product_id))
-        product = result.scalar_one_or_none()
-        
-        if not product:
+        # Relationships on Product are view-only, so there is no ORM cascade to
+        # run; the foreign keys decide what happens to dependent rows
+        restaurant_id = await db.scalar(
+            select(Product.restaurant_id).where(Product.id == product_id)
+        )
+        if restaurant_id is None:
             return False
         
-        await db.delete(product)
+        await db.execute(delete(Product).where(Product.id == product_id))
         await db.commit()
+        await invalidate_menu(restaurant_id)
         return True
 
 
@@ -589,8 +642,7 @@ class ModifierService:
         """Create a new modifier"""
         modifier = Modifier(**modifier_data.model_dump())
         db.add(modifier)
-        await db.commit()
-        await db.refresh(modifier)
+        await commit_menu(db)
         return modifier
 
     @staticmethod
@@ -609,15 +661,13 @@ class ModifierService:
         for field, value in update_data.items():
             setattr(modifier, field, value)
 
-        await db.commit()
-        await db.refresh(modifier)
+        await commit_menu(db)
         return modifier
     
     @staticmethod
     async def get_modifier_by_id(db: AsyncSession, modifier_id: str) -> Optional[Modifier]:
-        """Get modifier by ID"""
-        result = await db.execute(select(Modifier).where(Modifier.id == modifier_id))
-        return result.scalar_one_or_none()
+        """Get modifier by ID (served from the session identity map when already loaded)"""
+        return await db.get(Modifier, modifier_id)
     
     @staticmethod
     async def get_modifiers_by_restaurant(
@@ -627,7 +677,13 @@ class ModifierService:
         limit: int = 100
     ) -> List[Modifier]:
         """Get modifiers by restaurant"""
-        query = select(Modifier).where(Modifier.restaurant_id == restaurant_id)
+        # Listings serialize modifiers without options; skip the mapper's
+        # selectin load of Modifier.options
+        query = (
+            select(Modifier)
+            .options(raiseload("*"))
+            .where(Modifier.restaurant_id == restaurant_id)
+        )
         query = query.order_by(Modifier.name).offset(skip).limit(limit)
         result = await db.execute(query)
         return list(result.scalars().all())
@@ -641,7 +697,7 @@ class ModifierService:
             return False
 
         await db.delete(modifier)
-        await db.commit()
+        await commit_menu(db)
         return True
     
     @staticmethod
@@ -652,8 +708,7 @@ class ModifierService:
         """Create a new modifier option"""
         option = ModifierOption(**option_data.model_dump())
         db.add(option)
-        await db.commit()
-        await db.refresh(option)
+        await commit_menu(db)
         return option
     
     @staticmethod
@@ -662,11 +717,7 @@ class ModifierService:
         modifier_id: str
     ) -> List[ModifierOption]:
         """Get options for a modifier"""
-        query = select(ModifierOption).where(
-            ModifierOption.modifier_id == modifier_id
-        ).order_by(ModifierOption.sort_order, ModifierOption.name)
-        
-        result = await db.execute(query)
+        result = await db.execute(_MODIFIER_OPTIONS, {"modifier_id": modifier_id})
         return list(result.scalars().all())
 
     @staticmethod
@@ -674,11 +725,8 @@ class ModifierService:
         db: AsyncSession,
         option_id: str
     ) -> Optional[ModifierOption]:
-        """Get modifier option by ID"""
-        result = await db.execute(
-            select(ModifierOption).where(ModifierOption.id == option_id)
-        )
-        return result.scalar_one_or_none()
+        """Get modifier option by ID (served from the session identity map when already loaded)"""
+        return await db.get(ModifierOption, option_id)
 
     @staticmethod
     async def update_modifier_option(
@@ -695,8 +743,7 @@ class ModifierService:
         for field, value in update_data.items():
             setattr(option, field, value)
 
-        await db.commit()
-        await db.refresh(option)
+        await commit_menu(db)
         return option
 
     @staticmethod
@@ -710,7 +757,7 @@ class ModifierService:
             return False
 
         await db.delete(option)
-        await db.commit()
+        await commit_menu(db)
         return True
 
     @staticmethod
@@ -721,13 +768,29 @@ class ModifierService:
         """Get all modifiers with their options for a restaurant"""
         query = (
             select(Modifier)
-            .options(joinedload(Modifier.options))
+            .options(selectinload(Modifier.options))
             .where(Modifier.restaurant_id == restaurant_id)
             .order_by(Modifier.name)
         )
         
         result = await db.execute(query)
-        return list(result.unique().scalars().all())
+        return list(result.scalars().all())
+
+
+# Newest first; id breaks ties because DATETIME only has second precision.
+# Matches the (restaurant_id, created_at, id) primary key.
+_TRANSACTION_ORDER = (InventoryTransaction.created_at.desc(), InventoryTransaction.id.desc())
+
+
+def _before_transaction(before: datetime, before_id: str):
+    """Keyset cursor: rows strictly after (before, before_id) in _TRANSACTION_ORDER"""
+    return or_(
+        InventoryTransaction.created_at < before,
+        and_(
+            InventoryTransaction.created_at == before,
+            InventoryTransaction.id < before_id,
+        ),
+    )
 
 
 class InventoryService:
@@ -740,11 +803,14 @@ class InventoryService:
         user_id: Optional[str] = None
     ) -> InventoryTransaction:
         """Create inventory transaction and update stock"""
-        # Get current product
+        # Lock just the stock value; concurrent adjustments queue on the row
+        # instead of overwriting each other's result
         result = await db.execute(
-            select(Product).where(Product.id == transaction_data.product_id)
+            select(Product.stock, Product.restaurant_id)
+            .where(Product.id == transaction_data.product_id)
+            .with_for_update()
         )
-        product = result.scalar_one_or_none()
+        product = result.one_or_none()
         
         if not product:
             raise ValueError("Product not found")
@@ -778,11 +844,18 @@ class InventoryService:
         )
         
         # Update product stock
-        product.stock = new_stock
+        await db.execute(
+            update(Product)
+            .where(Product.id == transaction_data.product_id)
+            .values(stock=new_stock)
+        )
         
         db.add(transaction)
+        # id and created_at are Python-side defaults; with expire_on_commit=False
+        # nothing needs reloading.
         await db.commit()
-        await db.refresh(transaction)
+        # The stock UPDATE bypasses the flush hooks that retire cached menus
+        await invalidate_menu(product.restaurant_id)
         
         return transaction
     
@@ -805,20 +878,77 @@ class InventoryService:
         
         return await InventoryService.create_transaction(db, transaction_data, user_id)
     
+    @staticmethod
+    async def bulk_adjust_stock(
+        db: AsyncSession,
+        restaurant_id: str,
+        adjustments: List[StockAdjustment],
+        user_id: Optional[str] = None
+    ) -> List[InventoryTransaction]:
+        """Adjust stock for several products in one transaction (all or nothing)"""
+        product_ids = {adjustment.product_id for adjustment in adjustments}
+        result = await db.execute(
+            select(Product.id, Product.stock)
+            .where(Product.id.in_(product_ids), Product.restaurant_id == restaurant_id)
+            .with_for_update()
+        )
+        stock_by_id: Dict[str, int] = dict(result.all())
+        
+        missing_ids = product_ids - stock_by_id.keys()
+        if missing_ids:
+            raise ValueError(f"Products not found: {', '.join(sorted(missing_ids))}")
+        
+        # StockAdjustmentBulk guarantees each product appears once
+        transactions = []
+        for adjustment in adjustments:
+            previous_stock = stock_by_id[adjustment.product_id]
+            new_stock = previous_stock + adjustment.quantity
+            if new_stock < 0:
+                raise ValueError(f"Insufficient stock for product {adjustment.product_id}")
+            stock_by_id[adjustment.product_id] = new_stock
+            transactions.append(InventoryTransaction(
+                restaurant_id=restaurant_id,
+                product_id=adjustment.product_id,
+                type=adjustment.type,
+                quantity=adjustment.quantity,
+                previous_stock=previous_stock,
+                new_stock=new_stock,
+                notes=adjustment.notes,
+                performed_by=user_id
+            ))
+        
+        # One UPDATE for every product, one multi-row INSERT for the history
+        await db.execute(
+            update(Product)
+            .where(Product.id.in_(product_ids))
+            .values(stock=case(stock_by_id, value=Product.id))
+        )
+        db.add_all(transactions)
+        await db.commit()
+        # The stock UPDATE bypasses the flush hooks that retire cached menus
+        await invalidate_menu(restaurant_id)
+        
+        return transactions
+    
     @staticmethod
     async def get_product_transactions(
         db: AsyncSession,
         product_id: str,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[InventoryTransaction]:
-        """Get transactions for a product"""
-        query = select(InventoryTransaction).where(
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[str] = None
+    ) -> List[Row]:
+        """Get transactions for a product as plain rows, newest first (keyset cursor optional)"""
+        query = select(*INVENTORY_TRANSACTION_LIST_COLUMNS).where(
             InventoryTransaction.product_id == product_id
-        ).order_by(InventoryTransaction.created_at.desc()).offset(skip).limit(limit)
+        )
+        if before is not None:
+            query = query.where(_before_transaction(before, before_id))
         
+        query = query.order_by(*_TRANSACTION_ORDER).offset(skip).limit(limit)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
     
     @staticmethod
     async def get_restaurant_transactions(
@@ -826,19 +956,23 @@ class InventoryService:
         restaurant_id: str,
         transaction_type: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[InventoryTransaction]:
-        """Get transactions for a restaurant"""
-        query = select(InventoryTransaction).where(
+        limit: int = 100,
+        before: Optional[datetime] = None,
+        before_id: Optional[str] = None
+    ) -> List[Row]:
+        """Get transactions for a restaurant as plain rows, newest first (keyset cursor optional)"""
+        query = select(*INVENTORY_TRANSACTION_LIST_COLUMNS).where(
             InventoryTransaction.restaurant_id == restaurant_id
         )
         
         if transaction_type:
             query = query.where(InventoryTransaction.type == transaction_type)
+        if before is not None:
+            query = query.where(_before_transaction(before, before_id))
         
-        query = query.order_by(InventoryTransaction.created_at.desc()).offset(skip).limit(limit)
+        query = query.order_by(*_TRANSACTION_ORDER).offset(skip).limit(limit)
         result = await db.execute(query)
-        return list(result.scalars().all())
+        return list(result.all())
 
 
 class ComboProductService:
@@ -849,15 +983,13 @@ class ComboProductService:
         """Create a new combo product"""
         combo = ComboProduct(**combo_data.model_dump())
         db.add(combo)
-        await db.commit()
-        await db.refresh(combo)
+        await commit_menu(db)
         return combo
     
     @staticmethod
     async def get_combo_by_id(db: AsyncSession, combo_id: str) -> Optional[ComboProduct]:
         """Get combo by ID"""
-        result = await db.execute(select(ComboProduct).where(ComboProduct.id == combo_id))
-        return result.scalar_one_or_none()
+        return await db.get(ComboProduct, combo_id)
 
     @staticmethod
     async def update_combo(
@@ -873,8 +1005,7 @@ class ComboProductService:
         update_data = combo_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(combo, field, value)
-        await db.commit()
-        await db.refresh(combo)
+        await commit_menu(db)
         return combo
 
     @staticmethod
@@ -903,7 +1034,12 @@ class ComboProductService:
         limit: int = 100
     ) -> List[ComboProduct]:
         """Get combo products by restaurant"""
-        query = select(ComboProduct).where(ComboProduct.restaurant_id == restaurant_id)
+        # Combo responses carry no items; loading them lazily per row must raise
+        query = (
+            select(ComboProduct)
+            .options(raiseload("*"))
+            .where(ComboProduct.restaurant_id == restaurant_id)
+        )
         
         if available_only:
             query = query.where(ComboProduct.available == True)
@@ -917,8 +1053,7 @@ class ComboProductService:
         """Add item to combo"""
         item = ComboItem(**item_data.model_dump())
         db.add(item)
-        await db.commit()
-        await db.refresh(item)
+        await commit_menu(db)
         return item
 
     @staticmethod
@@ -928,17 +1063,11 @@ class ComboProductService:
             return []
         items = [ComboItem(**item.model_dump()) for item in items_data]
         db.add_all(items)
-        await db.commit()
-        for item in items:
-            await db.refresh(item)
+        await commit_menu(db)
         return items
     
     @staticmethod
     async def get_combo_items(db: AsyncSession, combo_id: str) -> List[ComboItem]:
         """Get items in a combo"""
-        query = select(ComboItem).where(
-            ComboItem.combo_id == combo_id
-        ).order_by(ComboItem.sort_order)
-        
-        result = await db.execute(query)
+        result = await db.execute(_COMBO_ITEMS, {"combo_id": combo_id})
         return list(result.scalars().all())
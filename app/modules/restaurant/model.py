@@ -1,7 +1,7 @@
 """
 Multi-tenant Restaurant models for SaaS platform
 """
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Text, JSON, Enum as SQLEnum
+from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey, Text, JSON, Computed, UniqueConstraint, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import Optional, List
@@ -228,11 +228,11 @@ class Restaurant(Base):
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)  # Soft delete
     
     # Relationships
-    roles: Mapped[List["Role"]] = relationship("Role", back_populates="restaurant")
-    staff: Mapped[List["Staff"]] = relationship("Staff", back_populates="restaurant")
-    shifts: Mapped[List["Shift"]] = relationship("Shift", back_populates="restaurant")
-    attendance_records: Mapped[List["Attendance"]] = relationship("Attendance", back_populates="restaurant")
-    leave_applications: Mapped[List["LeaveApplication"]] = relationship("LeaveApplication", back_populates="restaurant")
+    roles: Mapped[List["Role"]] = relationship("Role", back_populates="restaurant", passive_deletes=True)
+    staff: Mapped[List["Staff"]] = relationship("Staff", back_populates="restaurant", passive_deletes=True)
+    shifts: Mapped[List["Shift"]] = relationship("Shift", back_populates="restaurant", passive_deletes=True)
+    attendance_records: Mapped[List["Attendance"]] = relationship("Attendance", back_populates="restaurant", passive_deletes=True)
+    leave_applications: Mapped[List["LeaveApplication"]] = relationship("LeaveApplication", back_populates="restaurant", passive_deletes=True)
     
     def __repr__(self):
         return f"<Restaurant(id={self.id}, name='{self.name}', slug='{self.slug}', plan='{self.subscription_plan}')>"
@@ -244,19 +244,23 @@ class RestaurantOwner(Base):
     A user can own multiple restaurants.
     """
     __tablename__ = "restaurant_owners"
+    __table_args__ = (
+        # "Restaurants of this user": InnoDB secondary indexes carry the PK, so
+        # this also yields restaurant_id without touching the row
+        Index("ix_restaurant_owners_user_active", "user_id", "is_active"),
+    )
     
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Composite primary key: (restaurant_id, user_id) is the row identity.
+    # The PK also serves restaurant_id lookups; user_id is served by the index above.
     restaurant_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("restaurants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        primary_key=True
     )
     user_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        primary_key=True
     )
     
     # Role & Permissions
@@ -339,13 +343,16 @@ class Subscription(Base):
     Tracks subscription history and billing for each restaurant.
     """
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        # Active subscription lookup: restaurant + status, newest first
+        Index("ix_subscriptions_restaurant_status_created", "restaurant_id", "status", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("restaurants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Plan Details
@@ -377,7 +384,7 @@ class Subscription(Base):
     # Payment
     payment_method: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     payment_gateway_customer_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    payment_gateway_subscription_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    payment_gateway_subscription_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, unique=True, index=True)  # webhook lookup key
     last_payment_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     next_payment_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
@@ -409,6 +416,10 @@ class Invoice(Base):
     Billing invoices for subscriptions.
     """
     __tablename__ = "invoices"
+    __table_args__ = (
+        # Invoice history per restaurant, newest first
+        Index("ix_invoices_restaurant_created", "restaurant_id", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     subscription_id: Mapped[str] = mapped_column(
@@ -420,8 +431,7 @@ class Invoice(Base):
     restaurant_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("restaurants.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Invoice Details
@@ -476,6 +486,11 @@ class RestaurantInvitation(Base):
     Pending invitations to join a restaurant team.
     """
     __tablename__ = "restaurant_invitations"
+    __table_args__ = (
+        # MySQL has no partial indexes: pending_email is NULL unless the invite is
+        # pending, and NULLs never collide, so this only dedupes pending invites.
+        UniqueConstraint("restaurant_id", "pending_email", name="uq_restaurant_invitations_pending_email"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     restaurant_id: Mapped[str] = mapped_column(
@@ -501,6 +516,11 @@ class RestaurantInvitation(Base):
     
     # Status
     status: Mapped[str] = mapped_column(String(20), default='pending', nullable=False)
+    pending_email: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        Computed("IF(status = 'pending', email, NULL)", persisted=True),
+        nullable=True
+    )
     accepted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     accepted_by: Mapped[Optional[str]] = mapped_column(
         String(36),
@@ -643,6 +643,12 @@ async def create_invitation(
             message="Invitation created successfully",
             data=RestaurantInvitationResponse.model_validate(invitation).model_dump(),
         )
+    except ValueError as ve:
+        return error_response(
+            message=str(ve),
+            error_code="INVITATION_EXISTS",
+            status_code=status.HTTP_409_CONFLICT,
+        )
     except Exception as e:
         return error_response(
             message="Failed to create invitation",
@@ -606,7 +606,6 @@ class RestaurantInvitationResponse(BaseModel):
 
 class RestaurantOwnerResponse(BaseModel):
     """Schema for restaurant owner response"""
-    id: str
     restaurant_id: str
     user_id: str
     role: str
@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, func, and_, or_
 from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
 from datetime import datetime, timedelta
@@ -29,6 +29,15 @@ from app.modules.restaurant.schema import (
 )
 
 
+# Usage counter and plan limit columns per enforced resource type. Limit checks
+# read just these two columns instead of the full restaurants row.
+USAGE_LIMIT_COLUMNS = {
+    "users": (Restaurant.current_users, Restaurant.max_users),
+    "products": (Restaurant.current_products, Restaurant.max_products),
+    "orders": (Restaurant.current_orders_this_month, Restaurant.max_orders_per_month),
+}
+
+
 class RestaurantService:
     """Service layer for restaurant operations"""
     
@@ -93,7 +102,6 @@ class RestaurantService:
         
         # Create owner relationship
         owner = RestaurantOwner(
-            id=str(uuid.uuid4()),
             restaurant_id=restaurant.id,
             user_id=owner_user_id,
             role='owner'
@@ -208,40 +216,58 @@ class RestaurantService:
         Returns:
             True if within limits, False otherwise
         """
-        restaurant = await RestaurantService.get_restaurant_by_id(db, restaurant_id)
-        if not restaurant:
+        columns = USAGE_LIMIT_COLUMNS.get(resource_type)
+        if not columns:
             return False
         
-        if resource_type == "users":
-            return restaurant.current_users < restaurant.max_users
-        elif resource_type == "products":
-            return restaurant.current_products < restaurant.max_products
-        elif resource_type == "orders":
-            return restaurant.current_orders_this_month < restaurant.max_orders_per_month
+        current_col, max_col = columns
+        result = await db.execute(
+            select(current_col, max_col).where(
+                and_(
+                    Restaurant.id == restaurant_id,
+                    Restaurant.deleted_at.is_(None)
+                )
+            )
+        )
+        row = result.first()
+        if not row:
+            return False
         
-        return False
+        return row[0] < row[1]
     
     @staticmethod
     async def increment_usage(
         db: AsyncSession,
         restaurant_id: str,
         resource_type: str,
-        amount: int = 1
+        amount: int = 1,
+        *,
+        commit: bool = True,
     ) -> bool:
-        """Increment usage counter"""
-        restaurant = await RestaurantService.get_restaurant_by_id(db, restaurant_id)
-        if not restaurant:
+        """
+        Increment usage counter
+
+        Pass commit=False to leave the bump in the caller's transaction, so it
+        commits (or rolls back) together with the row being counted.
+        """
+        columns = USAGE_LIMIT_COLUMNS.get(resource_type)
+        if not columns:
             return False
         
-        if resource_type == "users":
-            restaurant.current_users += amount
-        elif resource_type == "products":
-            restaurant.current_products += amount
-        elif resource_type == "orders":
-            restaurant.current_orders_this_month += amount
-        
-        await db.commit()
-        return True
+        current_col = columns[0]
+        result = await db.execute(
+            update(Restaurant)
+            .where(
+                and_(
+                    Restaurant.id == restaurant_id,
+                    Restaurant.deleted_at.is_(None)
+                )
+            )
+            .values({current_col: current_col + amount})
+        )
+        if commit:
+            await db.commit()
+        return result.rowcount > 0
 
 
 class SubscriptionPlanService:
@@ -534,6 +560,20 @@ class RestaurantInvitationService:
         invited_by_user_id: str
     ) -> RestaurantInvitation:
         """Create a new restaurant invitation"""
+        now = datetime.utcnow()
+        # A lapsed pending invite would otherwise hold the pending-email slot
+        # forever, since only accept_invitation ever marks invites expired
+        await db.execute(
+            update(RestaurantInvitation)
+            .where(
+                RestaurantInvitation.restaurant_id == restaurant_id,
+                RestaurantInvitation.email == invitation_data.email,
+                RestaurantInvitation.status == 'pending',
+                RestaurantInvitation.expires_at < now,
+            )
+            .values(status='expired')
+        )
+
         # Generate unique token
         token = secrets.token_urlsafe(32)
         
@@ -546,11 +586,17 @@ class RestaurantInvitationService:
             token=token,
             invited_by=invited_by_user_id,
             message=invitation_data.message,
-            expires_at=datetime.utcnow() + timedelta(days=7)
+            expires_at=now + timedelta(days=7)
         )
         
         db.add(invitation)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError as e:
+            await db.rollback()
+            if "uq_restaurant_invitations_pending_email" not in str(e.orig):
+                raise
+            raise ValueError(f"A pending invitation already exists for {invitation_data.email}")
         await db.refresh(invitation)
         
         return invitation
@@ -591,15 +637,20 @@ class RestaurantInvitationService:
         invitation.accepted_at = datetime.utcnow()
         invitation.accepted_by = user_id
         
-        # Create restaurant owner relationship
-        owner = RestaurantOwner(
-            id=str(uuid.uuid4()),
-            restaurant_id=invitation.restaurant_id,
-            user_id=user_id,
-            role=invitation.role,
-            invited_by=invitation.invited_by
-        )
-        db.add(owner)
+        # Create (or re-activate) restaurant owner relationship
+        owner = await db.get(RestaurantOwner, (invitation.restaurant_id, user_id))
+        if owner:
+            owner.role = invitation.role
+            owner.invited_by = invitation.invited_by
+            owner.is_active = True
+        else:
+            owner = RestaurantOwner(
+                restaurant_id=invitation.restaurant_id,
+                user_id=user_id,
+                role=invitation.role,
+                invited_by=invitation.invited_by
+            )
+            db.add(owner)
         
         await db.commit()
         await db.refresh(invitation)
@@ -147,7 +147,7 @@ class Role(Base):
     
     # Relationships
     restaurant = relationship("Restaurant", back_populates="roles")
-    permissions = relationship("RolePermission", back_populates="role", cascade="all, delete-orphan")
+    permissions = relationship("RolePermission", back_populates="role", cascade="all, delete-orphan", passive_deletes=True)
     staff_members = relationship("Staff", back_populates="role")
 
 
@@ -238,11 +238,11 @@ class Staff(Base):
     
     # Relationships
     restaurant = relationship("Restaurant", back_populates="staff")
-    user = relationship("User", foreign_keys=[user_id])
+    user = relationship("User", foreign_keys=[user_id], viewonly=True)
     role = relationship("Role", back_populates="staff_members")
-    attendance_records = relationship("Attendance", back_populates="staff", cascade="all, delete-orphan")
-    shifts = relationship("Shift", back_populates="staff", cascade="all, delete-orphan")
-    leave_applications = relationship("LeaveApplication", back_populates="staff", cascade="all, delete-orphan")
+    attendance_records = relationship("Attendance", back_populates="staff", cascade="all, delete-orphan", passive_deletes=True)
+    shifts = relationship("Shift", back_populates="staff", cascade="all, delete-orphan", passive_deletes=True)
+    leave_applications = relationship("LeaveApplication", back_populates="staff", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class Shift(Base):
@@ -335,7 +335,7 @@ class Attendance(Base):
     # Relationships
     restaurant = relationship("Restaurant", back_populates="attendance_records")
     staff = relationship("Staff", back_populates="attendance_records")
-    shift = relationship("Shift")
+    shift = relationship("Shift", viewonly=True)
 
 
 class LeaveApplication(Base):
@@ -379,7 +379,7 @@ class LeaveApplication(Base):
     # Relationships
     restaurant = relationship("Restaurant", back_populates="leave_applications")
     staff = relationship("Staff", back_populates="leave_applications")
-    approver = relationship("User", foreign_keys=[approved_by])
+    approver = relationship("User", foreign_keys=[approved_by], viewonly=True)
 
 
 class LeaveBalance(Base):
@@ -407,5 +407,5 @@ class LeaveBalance(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    restaurant = relationship("Restaurant")
-    staff = relationship("Staff")
+    restaurant = relationship("Restaurant", viewonly=True)
+    staff = relationship("Staff", viewonly=True)
@@ -1,11 +1,21 @@
-from sqlalchemy import String, Boolean, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Boolean, DateTime, Integer, BigInteger, ForeignKey, Computed
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column
 from datetime import datetime
 from typing import Optional
+import hashlib
 import uuid
 from app.core.database import Base
 
 
+def email_lookup_hash(email: str) -> int:
+    """
+    64-bit lookup key for an email, matching the ``users.email_hash`` generated column
+    (first 16 hex digits of SHA-256 over the lower-cased address).
+    """
+    return int(hashlib.sha256(email.lower().encode("utf-8")).hexdigest()[:16], 16)
+
+
 class User(Base):
     """User database model"""
     
@@ -13,6 +23,12 @@ class User(Base):
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
+    # Narrow integer key for login/email lookups; always paired with an email equality check
+    email_hash: Mapped[int] = mapped_column(
+        BigInteger().with_variant(mysql.BIGINT(unsigned=True), "mysql"),
+        Computed("CONV(LEFT(SHA2(LOWER(email), 256), 16), 16, 10)", persisted=True),
+        index=True
+    )
     username: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
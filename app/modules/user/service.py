@@ -1,10 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, Row
 from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
-from app.modules.user.model import User
-from app.modules.user.schema import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.modules.user.model import User, email_lookup_hash
+from app.modules.user.schema import UserCreate, UserUpdate, UserResponse
+from app.core.security import get_password_hash
+
+
+# Columns needed to render UserResponse. List endpoints select these as plain
+# rows instead of hydrating full User instances into the identity map.
+USER_LIST_COLUMNS = tuple(getattr(User, name) for name in UserResponse.model_fields)
 
 
 class UserService:
@@ -73,7 +78,27 @@ class UserService:
         Returns:
             User or None if not found
         """
-        result = await db.execute(select(User).where(User.email == email))
+        result = await db.execute(
+            select(User).where(
+                User.email_hash == email_lookup_hash(email),
+                User.email == email
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def get_active_flag(db: AsyncSession, user_id: str) -> Optional[bool]:
+        """
+        Get only a user's is_active flag
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            is_active, or None if the user does not exist
+        """
+        result = await db.execute(select(User.is_active).where(User.id == user_id))
         return result.scalar_one_or_none()
     
     @staticmethod
@@ -92,7 +117,7 @@ class UserService:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[Row]:
         """
         Get list of users with pagination
         
@@ -102,10 +127,10 @@ class UserService:
             limit: Maximum number of records to return
             
         Returns:
-            List of users
+            List of user rows (UserResponse columns only)
         """
-        result = await db.execute(select(User).offset(skip).limit(limit))
-        return list(result.scalars().all())
+        result = await db.execute(select(*USER_LIST_COLUMNS).offset(skip).limit(limit))
+        return list(result.all())
     
     @staticmethod
     async def get_users_by_restaurant(
@@ -113,7 +138,7 @@ class UserService:
         restaurant_id: str,
         skip: int = 0,
         limit: int = 100
-    ) -> List[User]:
+    ) -> List[Row]:
         """
         Get list of users by restaurant ID with pagination
         
@@ -124,15 +149,15 @@ class UserService:
             limit: Maximum number of records to return
             
         Returns:
-            List of users belonging to the restaurant
+            List of user rows (UserResponse columns only) belonging to the restaurant
         """
         result = await db.execute(
-            select(User)
+            select(*USER_LIST_COLUMNS)
             .where(User.restaurant_id == restaurant_id)
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return list(result.all())
     
     @staticmethod
     async def update_user(db: AsyncSession, user_id: str, user_data: UserUpdate) -> Optional[User]:
@@ -213,33 +238,3 @@ class UserService:
         await db.commit()
         
         return True
-    
-    @staticmethod
-    async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
-        """
-        Authenticate user by email and password
-        
-        Args:
-            db: Database session
-            email: User email
-            password: Plain text password
-            
-        Returns:
-            User if authenticated, None otherwise
-        """
-        from datetime import datetime
-        
-        user = await UserService.get_user_by_email(db, email)
-        
-        if not user:
-            return None
-        
-        if not verify_password(password, user.hashed_password):
-            return None
-        
-        # Update last login timestamp
-        user.last_login = datetime.utcnow()
-        await db.commit()
-        await db.refresh(user)
-        
-        return user
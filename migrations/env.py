@@ -48,7 +48,7 @@ from app.modules.product.model import (
     Product,
     Modifier,
     ModifierOption,
-    ProductModifier,
+    product_modifiers,
     ComboProduct,
     ComboItem,
     InventoryTransaction,
@@ -0,0 +1,62 @@
+"""products: SMALLINT counters and non-negative price/stock checks
+
+Revision ID: a6c0e4f8b2d7
+Revises: f5b9d3e7a1c6
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a6c0e4f8b2d7"
+down_revision: Union[str, None] = "f5b9d3e7a1c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SMALLINT_COLUMNS = (
+    ("categories", "sort_order"),
+    ("products", "sort_order"),
+    ("products", "min_stock"),
+    ("products", "preparation_time"),
+    ("modifier_options", "sort_order"),
+    ("combo_products", "max_quantity_per_order"),
+    ("combo_items", "sort_order"),
+)
+
+PRODUCT_CHECKS = (
+    ("ck_products_price_non_negative", "price >= 0"),
+    ("ck_products_stock_non_negative", "stock >= 0"),
+    ("ck_products_min_stock_non_negative", "min_stock >= 0"),
+)
+
+
+def upgrade() -> None:
+    # CHECK constraints are enforced from MySQL 8.0.16; adding them fails if
+    # any existing row already violates them
+    for name, condition in PRODUCT_CHECKS:
+        op.create_check_constraint(name, "products", condition)
+    for table, column in SMALLINT_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.Integer(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(SMALLINT_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.Integer(),
+            existing_nullable=False,
+        )
+    for name, _ in reversed(PRODUCT_CHECKS):
+        op.drop_constraint(name, "products", type_="check")
@@ -0,0 +1,50 @@
+"""composite indexes for login_logs listing queries, replacing single-column ones
+
+Revision ID: a9c3e7f1b5d8
+Revises: f8b2d6e0a4c7
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "a9c3e7f1b5d8"
+down_revision: Union[str, None] = "f8b2d6e0a4c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_login_logs_email_attempted_at",
+        "login_logs",
+        ["email", "attempted_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_login_logs_user_id_attempted_at",
+        "login_logs",
+        ["user_id", "attempted_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_login_logs_is_suspicious_attempted_at",
+        "login_logs",
+        ["is_suspicious", "attempted_at"],
+        unique=False,
+    )
+    # The composites lead with email/user_id; attempted_at is never queried alone
+    op.drop_index(op.f("ix_login_logs_email"), table_name="login_logs")
+    op.drop_index(op.f("ix_login_logs_user_id"), table_name="login_logs")
+    op.drop_index(op.f("ix_login_logs_attempted_at"), table_name="login_logs")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_login_logs_attempted_at"), "login_logs", ["attempted_at"], unique=False)
+    op.create_index(op.f("ix_login_logs_user_id"), "login_logs", ["user_id"], unique=False)
+    op.create_index(op.f("ix_login_logs_email"), "login_logs", ["email"], unique=False)
+    op.drop_index("ix_login_logs_is_suspicious_attempted_at", table_name="login_logs")
+    op.drop_index("ix_login_logs_user_id_attempted_at", table_name="login_logs")
+    op.drop_index("ix_login_logs_email_attempted_at", table_name="login_logs")
@@ -0,0 +1,64 @@
+"""composite indexes for menu and inventory listings
+
+Revision ID: b1d5f9a3c7e2
+Revises: a9c3e7f1b5d8
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b1d5f9a3c7e2"
+down_revision: Union[str, None] = "a9c3e7f1b5d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_products_restaurant_category_available",
+        "products",
+        ["restaurant_id", "category_id", "available"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_products_restaurant_featured",
+        "products",
+        ["restaurant_id", "featured"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_categories_restaurant_active_sort",
+        "categories",
+        ["restaurant_id", "active", "sort_order"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_inventory_transactions_restaurant_created",
+        "inventory_transactions",
+        ["restaurant_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_inventory_transactions_product_created",
+        "inventory_transactions",
+        ["product_id", "created_at"],
+        unique=False,
+    )
+    # Low-selectivity boolean indexes now covered by the composites above
+    op.drop_index(op.f("ix_products_available"), table_name="products")
+    op.drop_index(op.f("ix_products_featured"), table_name="products")
+    op.drop_index(op.f("ix_categories_active"), table_name="categories")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_categories_active"), "categories", ["active"], unique=False)
+    op.create_index(op.f("ix_products_featured"), "products", ["featured"], unique=False)
+    op.create_index(op.f("ix_products_available"), "products", ["available"], unique=False)
+    op.drop_index("ix_inventory_transactions_product_created", table_name="inventory_transactions")
+    op.drop_index("ix_inventory_transactions_restaurant_created", table_name="inventory_transactions")
+    op.drop_index("ix_categories_restaurant_active_sort", table_name="categories")
+    op.drop_index("ix_products_restaurant_featured", table_name="products")
+    op.drop_index("ix_products_restaurant_category_available", table_name="products")
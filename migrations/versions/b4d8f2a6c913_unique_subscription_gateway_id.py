@@ -0,0 +1,36 @@
+"""make subscriptions.payment_gateway_subscription_id a unique index
+
+Revision ID: b4d8f2a6c913
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b4d8f2a6c913"
+down_revision: Union[str, None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f("ix_subscriptions_payment_gateway_subscription_id"), table_name="subscriptions")
+    op.create_index(
+        op.f("ix_subscriptions_payment_gateway_subscription_id"),
+        "subscriptions",
+        ["payment_gateway_subscription_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_subscriptions_payment_gateway_subscription_id"), table_name="subscriptions")
+    op.create_index(
+        op.f("ix_subscriptions_payment_gateway_subscription_id"),
+        "subscriptions",
+        ["payment_gateway_subscription_id"],
+        unique=False,
+    )
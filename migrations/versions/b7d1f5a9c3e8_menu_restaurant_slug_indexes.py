@@ -0,0 +1,45 @@
+"""categories, products, combo_products: restaurant-scoped slug indexes
+
+Revision ID: b7d1f5a9c3e8
+Revises: a6c0e4f8b2d7
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b7d1f5a9c3e8"
+down_revision: Union[str, None] = "a6c0e4f8b2d7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_categories_restaurant_slug", "categories", ["restaurant_id", "slug"], unique=False)
+    op.create_index("ix_products_restaurant_slug", "products", ["restaurant_id", "slug"], unique=False)
+    op.create_index(
+        "ix_combo_products_restaurant_slug",
+        "combo_products",
+        ["restaurant_id", "slug"],
+        unique=False,
+    )
+    # Name checks compare LOWER(name) and search uses LIKE '%...%'; neither
+    # can use a plain name index
+    op.drop_index(op.f("ix_categories_name"), table_name="categories")
+    op.drop_index(op.f("ix_categories_slug"), table_name="categories")
+    op.drop_index(op.f("ix_products_name"), table_name="products")
+    op.drop_index(op.f("ix_products_slug"), table_name="products")
+    op.drop_index(op.f("ix_combo_products_slug"), table_name="combo_products")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_combo_products_slug"), "combo_products", ["slug"], unique=False)
+    op.create_index(op.f("ix_products_slug"), "products", ["slug"], unique=False)
+    op.create_index(op.f("ix_products_name"), "products", ["name"], unique=False)
+    op.create_index(op.f("ix_categories_slug"), "categories", ["slug"], unique=False)
+    op.create_index(op.f("ix_categories_name"), "categories", ["name"], unique=False)
+    op.drop_index("ix_combo_products_restaurant_slug", table_name="combo_products")
+    op.drop_index("ix_products_restaurant_slug", table_name="products")
+    op.drop_index("ix_categories_restaurant_slug", table_name="categories")
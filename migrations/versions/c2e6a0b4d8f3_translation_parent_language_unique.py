@@ -0,0 +1,63 @@
+"""unique (parent, language_code) on translation tables
+
+Revision ID: c2e6a0b4d8f3
+Revises: b1d5f9a3c7e2
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c2e6a0b4d8f3"
+down_revision: Union[str, None] = "b1d5f9a3c7e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, parent FK column, unique constraint name)
+TRANSLATION_TABLES = (
+    ("category_translations", "category_id", "uq_category_translations_category_language"),
+    ("product_translations", "product_id", "uq_product_translations_product_language"),
+    ("modifier_translations", "modifier_id", "uq_modifier_translations_modifier_language"),
+    (
+        "modifier_option_translations",
+        "modifier_option_id",
+        "uq_modifier_option_translations_modifier_option_language",
+    ),
+    (
+        "combo_product_translations",
+        "combo_product_id",
+        "uq_combo_product_translations_combo_product_language",
+    ),
+)
+
+
+def upgrade() -> None:
+    # Keep the newest translation per (parent, language) in every table before
+    # any DDL runs: MySQL DDL is not transactional, so a duplicate must not be
+    # able to abort the loop halfway through
+    for table, parent_column, _ in TRANSLATION_TABLES:
+        op.execute(
+            f"""
+            DELETE t1 FROM {table} t1
+            INNER JOIN {table} t2
+                ON t1.{parent_column} = t2.{parent_column}
+                AND t1.language_code = t2.language_code
+                AND (t1.created_at < t2.created_at
+                     OR (t1.created_at = t2.created_at AND t1.id < t2.id))
+            """
+        )
+    for table, parent_column, constraint_name in TRANSLATION_TABLES:
+        # Composite key leads with the FK column, so it replaces the FK's own index
+        op.create_unique_constraint(constraint_name, table, [parent_column, "language_code"])
+        op.drop_index(op.f(f"ix_{table}_{parent_column}"), table_name=table)
+        op.drop_index(op.f(f"ix_{table}_language_code"), table_name=table)
+
+
+def downgrade() -> None:
+    for table, parent_column, constraint_name in TRANSLATION_TABLES:
+        op.create_index(op.f(f"ix_{table}_language_code"), table, ["language_code"], unique=False)
+        op.create_index(op.f(f"ix_{table}_{parent_column}"), table, [parent_column], unique=False)
+        op.drop_constraint(constraint_name, table, type_="unique")
@@ -0,0 +1,50 @@
+"""restaurant_owners: composite (restaurant_id, user_id) primary key
+
+Revision ID: c5e9a3b7d184
+Revises: b4d8f2a6c913
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c5e9a3b7d184"
+down_revision: Union[str, None] = "b4d8f2a6c913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the oldest link when the same user was linked to a restaurant twice
+    op.execute(
+        """
+        DELETE ro1 FROM restaurant_owners ro1
+        INNER JOIN restaurant_owners ro2
+            ON ro1.restaurant_id = ro2.restaurant_id
+            AND ro1.user_id = ro2.user_id
+            AND (ro1.created_at > ro2.created_at
+                 OR (ro1.created_at = ro2.created_at AND ro1.id > ro2.id))
+        """
+    )
+    op.drop_constraint("PRIMARY", "restaurant_owners", type_="primary")
+    op.create_primary_key("pk_restaurant_owners", "restaurant_owners", ["restaurant_id", "user_id"])
+    op.drop_column("restaurant_owners", "id")
+    # The composite PK leads with restaurant_id and now backs its FK
+    op.drop_index(op.f("ix_restaurant_owners_restaurant_id"), table_name="restaurant_owners")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_restaurant_owners_restaurant_id"),
+        "restaurant_owners",
+        ["restaurant_id"],
+        unique=False,
+    )
+    op.add_column("restaurant_owners", sa.Column("id", sa.String(length=36), nullable=True))
+    op.execute("UPDATE restaurant_owners SET id = UUID() WHERE id IS NULL")
+    op.alter_column("restaurant_owners", "id", existing_type=sa.String(length=36), nullable=False)
+    op.drop_constraint("PRIMARY", "restaurant_owners", type_="primary")
+    op.create_primary_key("pk_restaurant_owners", "restaurant_owners", ["id"])
@@ -0,0 +1,41 @@
+"""inventory_transactions: cluster on (restaurant_id, created_at, id)
+
+Revision ID: c8e2a6b0d4f9
+Revises: b7d1f5a9c3e8
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "c8e2a6b0d4f9"
+down_revision: Union[str, None] = "b7d1f5a9c3e8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The ORM still identifies rows by id alone, so keep it unique in the database
+    op.create_unique_constraint("uq_inventory_transactions_id", "inventory_transactions", ["id"])
+    op.drop_constraint("PRIMARY", "inventory_transactions", type_="primary")
+    op.create_primary_key(
+        "pk_inventory_transactions",
+        "inventory_transactions",
+        ["restaurant_id", "created_at", "id"],
+    )
+    # The primary key now leads with (restaurant_id, created_at)
+    op.drop_index("ix_inventory_transactions_restaurant_created", table_name="inventory_transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_inventory_transactions_restaurant_created",
+        "inventory_transactions",
+        ["restaurant_id", "created_at"],
+        unique=False,
+    )
+    op.drop_constraint("PRIMARY", "inventory_transactions", type_="primary")
+    op.create_primary_key("pk_inventory_transactions", "inventory_transactions", ["id"])
+    op.drop_constraint("uq_inventory_transactions_id", "inventory_transactions", type_="unique")
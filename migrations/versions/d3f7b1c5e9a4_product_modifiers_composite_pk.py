@@ -0,0 +1,42 @@
+"""product_modifiers: composite (product_id, modifier_id) primary key
+
+Revision ID: d3f7b1c5e9a4
+Revises: c2e6a0b4d8f3
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d3f7b1c5e9a4"
+down_revision: Union[str, None] = "c2e6a0b4d8f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the oldest link when the same modifier was attached to a product twice
+    op.execute(
+        """
+        DELETE pm1 FROM product_modifiers pm1
+        INNER JOIN product_modifiers pm2
+            ON pm1.product_id = pm2.product_id
+            AND pm1.modifier_id = pm2.modifier_id
+            AND (pm1.created_at > pm2.created_at
+                 OR (pm1.created_at = pm2.created_at AND pm1.id > pm2.id))
+        """
+    )
+    op.drop_constraint("PRIMARY", "product_modifiers", type_="primary")
+    op.create_primary_key("pk_product_modifiers", "product_modifiers", ["product_id", "modifier_id"])
+    op.drop_column("product_modifiers", "id")
+
+
+def downgrade() -> None:
+    op.add_column("product_modifiers", sa.Column("id", sa.String(length=36), nullable=True))
+    op.execute("UPDATE product_modifiers SET id = UUID() WHERE id IS NULL")
+    op.alter_column("product_modifiers", "id", existing_type=sa.String(length=36), nullable=False)
+    op.drop_constraint("PRIMARY", "product_modifiers", type_="primary")
+    op.create_primary_key("pk_product_modifiers", "product_modifiers", ["id"])
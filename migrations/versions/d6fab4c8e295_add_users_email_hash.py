@@ -0,0 +1,36 @@
+"""add users.email_hash generated lookup column
+
+Revision ID: d6fab4c8e295
+Revises: c5e9a3b7d184
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision: str = "d6fab4c8e295"
+down_revision: Union[str, None] = "c5e9a3b7d184"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "email_hash",
+            mysql.BIGINT(unsigned=True),
+            sa.Computed("CONV(LEFT(SHA2(LOWER(email), 256), 16), 16, 10)", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(op.f("ix_users_email_hash"), "users", ["email_hash"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_users_email_hash"), table_name="users")
+    op.drop_column("users", "email_hash")
@@ -0,0 +1,31 @@
+"""categories, products: indexes matching the menu listing sort order
+
+Revision ID: d9f3b7c1e5a0
+Revises: c8e2a6b0d4f9
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d9f3b7c1e5a0"
+down_revision: Union[str, None] = "c8e2a6b0d4f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_categories_restaurant_sort_name",
+        "categories",
+        ["restaurant_id", "sort_order", "name"],
+        unique=False,
+    )
+    op.create_index("ix_products_restaurant_name", "products", ["restaurant_id", "name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_restaurant_name", table_name="products")
+    op.drop_index("ix_categories_restaurant_sort_name", table_name="categories")
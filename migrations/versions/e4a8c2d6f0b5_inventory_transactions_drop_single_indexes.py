@@ -0,0 +1,45 @@
+"""inventory_transactions: drop single-column indexes covered by composites
+
+Revision ID: e4a8c2d6f0b5
+Revises: d3f7b1c5e9a4
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e4a8c2d6f0b5"
+down_revision: Union[str, None] = "d3f7b1c5e9a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (restaurant_id, created_at) and (product_id, created_at) serve every
+    # lookup these did, including the foreign keys
+    op.drop_index(op.f("ix_inventory_transactions_created_at"), table_name="inventory_transactions")
+    op.drop_index(op.f("ix_inventory_transactions_product_id"), table_name="inventory_transactions")
+    op.drop_index(op.f("ix_inventory_transactions_restaurant_id"), table_name="inventory_transactions")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_inventory_transactions_restaurant_id"),
+        "inventory_transactions",
+        ["restaurant_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_inventory_transactions_product_id"),
+        "inventory_transactions",
+        ["product_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_inventory_transactions_created_at"),
+        "inventory_transactions",
+        ["created_at"],
+        unique=False,
+    )
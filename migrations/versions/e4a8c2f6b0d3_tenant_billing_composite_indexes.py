@@ -0,0 +1,55 @@
+"""subscriptions, invoices, restaurant_owners: composite indexes for tenant lookups
+
+Revision ID: e4a8c2f6b0d3
+Revises: d9f3b7c1e5a0
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e4a8c2f6b0d3"
+down_revision: Union[str, None] = "d9f3b7c1e5a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_subscriptions_restaurant_status_created",
+        "subscriptions",
+        ["restaurant_id", "status", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_invoices_restaurant_created",
+        "invoices",
+        ["restaurant_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_restaurant_owners_user_active",
+        "restaurant_owners",
+        ["user_id", "is_active"],
+        unique=False,
+    )
+    # The composites lead with the same column and now back its FK
+    op.drop_index(op.f("ix_subscriptions_restaurant_id"), table_name="subscriptions")
+    op.drop_index(op.f("ix_invoices_restaurant_id"), table_name="invoices")
+    op.drop_index(op.f("ix_restaurant_owners_user_id"), table_name="restaurant_owners")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_restaurant_owners_user_id"),
+        "restaurant_owners",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_invoices_restaurant_id"), "invoices", ["restaurant_id"], unique=False)
+    op.create_index(op.f("ix_subscriptions_restaurant_id"), "subscriptions", ["restaurant_id"], unique=False)
+    op.drop_index("ix_restaurant_owners_user_active", table_name="restaurant_owners")
+    op.drop_index("ix_invoices_restaurant_created", table_name="invoices")
+    op.drop_index("ix_subscriptions_restaurant_status_created", table_name="subscriptions")
@@ -0,0 +1,66 @@
+"""unique pending invitation per (restaurant_id, email)
+
+Revision ID: e7a1c5d9f3b6
+Revises: d6fab4c8e295
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e7a1c5d9f3b6"
+down_revision: Union[str, None] = "d6fab4c8e295"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lapsed invites are still 'pending' (only acceptance ever expired them)
+    # and would otherwise hold the new unique slot
+    op.execute(
+        """
+        UPDATE restaurant_invitations
+        SET status = 'expired'
+        WHERE status = 'pending' AND expires_at < UTC_TIMESTAMP()
+        """
+    )
+    # Expire all but the newest pending invite for the same restaurant/email
+    op.execute(
+        """
+        UPDATE restaurant_invitations ri1
+        INNER JOIN restaurant_invitations ri2
+            ON ri1.restaurant_id = ri2.restaurant_id
+            AND ri1.email = ri2.email
+            AND ri2.status = 'pending'
+            AND (ri1.created_at < ri2.created_at
+                 OR (ri1.created_at = ri2.created_at AND ri1.id < ri2.id))
+        SET ri1.status = 'expired'
+        WHERE ri1.status = 'pending'
+        """
+    )
+    op.add_column(
+        "restaurant_invitations",
+        sa.Column(
+            "pending_email",
+            sa.String(length=255),
+            sa.Computed("IF(status = 'pending', email, NULL)", persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_unique_constraint(
+        "uq_restaurant_invitations_pending_email",
+        "restaurant_invitations",
+        ["restaurant_id", "pending_email"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_restaurant_invitations_pending_email",
+        "restaurant_invitations",
+        type_="unique",
+    )
+    op.drop_column("restaurant_invitations", "pending_email")
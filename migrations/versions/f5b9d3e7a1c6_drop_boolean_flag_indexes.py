@@ -0,0 +1,29 @@
+"""modifier_options, combo_products: drop standalone boolean flag indexes
+
+Revision ID: f5b9d3e7a1c6
+Revises: e4a8c2d6f0b5
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f5b9d3e7a1c6"
+down_revision: Union[str, None] = "e4a8c2d6f0b5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Two-value columns: lookups filter by restaurant or modifier first
+    op.drop_index(op.f("ix_modifier_options_available"), table_name="modifier_options")
+    op.drop_index(op.f("ix_combo_products_available"), table_name="combo_products")
+    op.drop_index(op.f("ix_combo_products_featured"), table_name="combo_products")
+
+
+def downgrade() -> None:
+    op.create_index(op.f("ix_combo_products_featured"), "combo_products", ["featured"], unique=False)
+    op.create_index(op.f("ix_combo_products_available"), "combo_products", ["available"], unique=False)
+    op.create_index(op.f("ix_modifier_options_available"), "modifier_options", ["available"], unique=False)
@@ -0,0 +1,29 @@
+"""composite index for login_logs failed-attempt counts
+
+Revision ID: f8b2d6e0a4c7
+Revises: e7a1c5d9f3b6
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f8b2d6e0a4c7"
+down_revision: Union[str, None] = "e7a1c5d9f3b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_login_logs_email_status_attempted_at",
+        "login_logs",
+        ["email", "status", "attempted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_login_logs_email_status_attempted_at", table_name="login_logs")
@@ -24,7 +24,7 @@ from app.modules.product.model import (
     Product,
     Modifier,
     ModifierOption,
-    ProductModifier,
+    product_modifiers,
     ComboProduct,
     ComboItem,
     InventoryTransaction,
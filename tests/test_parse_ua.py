@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+# Settings are required at import time; parse_ua itself touches none of them.
+for _key, _value in {
+    "DB_HOST": "localhost",
+    "DB_NAME": "test",
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "JWT_SECRET": "test",
+    "MINIO_ENDPOINT": "localhost:9000",
+    "MINIO_ACCESS_KEY": "test",
+    "MINIO_SECRET_KEY": "test",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+from app.modules.auth.route import parse_ua  # noqa: E402
+
+
+def _legacy_parse(user_agent: str) -> tuple:
+    """The substring checks parse_ua replaced (get_device_type + parse_user_agent)"""
+    ua = user_agent.lower()
+
+    if "mobile" in ua or "android" in ua or "iphone" in ua:
+        device_type = "mobile"
+    elif "tablet" in ua or "ipad" in ua:
+        device_type = "tablet"
+    else:
+        device_type = "desktop"
+
+    browser = "unknown"
+    if "chrome" in ua and "edg" not in ua:
+        browser = "Chrome"
+    elif "firefox" in ua:
+        browser = "Firefox"
+    elif "safari" in ua and "chrome" not in ua:
+        browser = "Safari"
+    elif "edg" in ua:
+        browser = "Edge"
+    elif "opera" in ua or "opr" in ua:
+        browser = "Opera"
+
+    operating_system = "unknown"
+    if "windows" in ua:
+        operating_system = "Windows"
+    elif "mac" in ua:
+        operating_system = "macOS"
+    elif "linux" in ua:
+        operating_system = "Linux"
+    elif "android" in ua:
+        operating_system = "Android"
+    elif "iphone" in ua or "ipad" in ua:
+        operating_system = "iOS"
+
+    return device_type, browser, operating_system
+
+
+BOT_AGENTS = [
+    "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+    "AdsBot-Google (+http://www.google.com/adsbot.html)",
+    "DuckAssistBot/1.0; (+http://duckduckgo.com/duckassistbot.html)",
+]
+
+BROWSER_AGENTS = {
+    "cubot_android": (
+        "Mozilla/5.0 (Linux; Android 10; CUBOT_X19) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+    ),
+    "chrome": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "edge": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
+    ),
+    "safari": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/17.2 Safari/605.1.15"
+    ),
+}
+
+
+@pytest.mark.parametrize("user_agent", BOT_AGENTS)
+def test_crawlers_are_flagged_as_bots(user_agent):
+    assert parse_ua(user_agent) == ("bot", "bot", "bot")
+
+
+@pytest.mark.parametrize("user_agent", BROWSER_AGENTS.values(), ids=BROWSER_AGENTS.keys())
+def test_browsers_match_legacy_precedence(user_agent):
+    assert parse_ua(user_agent) == _legacy_parse(user_agent)
+
+
+def test_cubot_is_not_a_bot():
+    assert parse_ua(BROWSER_AGENTS["cubot_android"]) == ("mobile", "Chrome", "Linux")
+
+
+def test_edge_and_safari_are_not_reported_as_chrome():
+    assert parse_ua(BROWSER_AGENTS["edge"])[1] == "Edge"
+    assert parse_ua(BROWSER_AGENTS["safari"]) == ("desktop", "Safari", "macOS")